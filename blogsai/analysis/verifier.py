@@ -211,7 +211,9 @@ class CitationVerifier:
                 # Get page source and extract text content
                 from bs4 import BeautifulSoup
 
-                soup = BeautifulSoup(self.driver.page_source, "html.parser")
+                from ..scrapers.base import HTML_PARSER
+
+                soup = BeautifulSoup(self.driver.page_source, HTML_PARSER)
 
                 # Remove unwanted elements
                 for unwanted in soup(
@@ -546,6 +546,7 @@ Article: {article_content}
                     id INTEGER PRIMARY KEY,
                     source_id INTEGER NOT NULL,
                     title TEXT NOT NULL,
+                    title_hash TEXT,
                     content TEXT NOT NULL,
                     url TEXT NOT NULL UNIQUE,
                     content_hash TEXT NOT NULL UNIQUE,
@@ -572,6 +573,10 @@ Article: {article_content}
                 )
             """
             )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS ix_articles_title_hash "
+                "ON articles (title_hash)"
+            )
 
             # Create reports table
             cursor.execute(
@@ -19,6 +19,9 @@ class ScrapingConfig(BaseModel):
     delay_between_requests: int = 1
     max_retries: int = 3
     timeout: int = 30
+    max_concurrent_per_host: int = 4
+    # Lifetime of cached HTTP responses when requests-cache is installed; 0 disables
+    http_cache_hours: int = 6
     user_agent: str = "BlogsAI/1.0"
 
 
@@ -72,6 +75,9 @@ class SourceConfig(BaseModel):
     enabled: bool = True
     press_releases_url: str = None
     rss_feeds: List[str] = None
+    # When False, individual article pages are fetched over plain HTTP
+    # instead of being rendered in ChromeDriver
+    article_pages_require_js: bool = True
 
 
 class Config(BaseModel):
@@ -330,6 +336,7 @@ class ConfigManager:
                             "scraper_type": "government",
                             "enabled": True,
                             "press_releases_url": "https://www.justice.gov/news",
+                            "article_pages_require_js": False,
                         },
                         "sec": {
                             "name": "Securities and Exchange Commission",
@@ -344,6 +351,7 @@ class ConfigManager:
                             "scraper_type": "government",
                             "enabled": True,
                             "press_releases_url": "https://www.cftc.gov/PressRoom/PressReleases",
+                            "article_pages_require_js": False,
                         },
                     }
                 }
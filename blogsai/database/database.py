@@ -7,7 +7,7 @@ from typing import Generator
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
-from .models import Base
+from .models import Base, generate_title_hash
 
 
 class DatabaseManager:
@@ -243,6 +243,37 @@ class DatabaseManager:
 
                 print("Modified at migration done")
 
+            # Check for title_hash column used for title deduplication
+            if "title_hash" not in columns:
+                print("Adding title_hash column...")
+
+                with self.engine.connect() as conn:
+                    conn.execute(
+                        text("ALTER TABLE articles ADD COLUMN title_hash VARCHAR(16)")
+                    )
+                    # Backfill existing rows in a single executemany pass
+                    rows = conn.execute(text("SELECT id, title FROM articles"))
+                    title_hashes = [
+                        {"id": article_id, "title_hash": generate_title_hash(title)}
+                        for article_id, title in rows
+                    ]
+                    if title_hashes:
+                        conn.execute(
+                            text(
+                                "UPDATE articles SET title_hash = :title_hash WHERE id = :id"
+                            ),
+                            title_hashes,
+                        )
+                    conn.execute(
+                        text(
+                            "CREATE INDEX IF NOT EXISTS ix_articles_title_hash "
+                            "ON articles (title_hash)"
+                        )
+                    )
+                    conn.commit()
+
+                print("Title hash migration done")
+
             # Check for high_priority_only column in reports table
             reports_columns = [col["name"] for col in inspector.get_columns("reports")]
             if "high_priority_only" not in reports_columns:
@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
@@ -18,6 +19,18 @@ from ..utils.timezone_utils import get_utc_now
 Base = declarative_base()
 
 
+def generate_title_hash(title: str) -> str:
+    """Return the dedup key for an article title (case/whitespace-insensitive)."""
+    normalized_title = title.strip().lower()
+    # A 64-bit BLAKE2b digest is plenty for a dedup key and cheaper than SHA-256
+    return hashlib.blake2b(normalized_title.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _default_title_hash(context) -> str:
+    """Column default that derives ``title_hash`` from the inserted title."""
+    return generate_title_hash(context.get_current_parameters()["title"])
+
+
 class Source(Base):
     __tablename__ = "sources"
     id = Column(Integer, primary_key=True)
@@ -38,6 +51,7 @@ class Article(Base):
     id = Column(Integer, primary_key=True)
     source_id = Column(Integer, ForeignKey("sources.id"), nullable=False)
     title = Column(String(500), nullable=False)
+    title_hash = Column(String(16), index=True, default=_default_title_hash)
     content = Column(Text, nullable=False)
     url = Column(String(1000), nullable=False, unique=True)
     content_hash = Column(String(64), nullable=False, unique=True)
@@ -4,13 +4,15 @@ import json
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
 from jinja2 import Template
 import markdown
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.platypus import (
     SimpleDocTemplate,
     Paragraph,
@@ -19,6 +21,7 @@ from reportlab.platypus import (
     Table,
     TableStyle,
 )
+from reportlab.platypus.flowables import Flowable
 from reportlab.lib.colors import black, blue, white, grey
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 
@@ -26,6 +29,455 @@ from ..core import get_db, config
 from ..database.models import Report, Article, Source
 from ..config.app_dirs import app_dirs
 
+# orjson is an optional, faster drop-in for json.loads; its JSONDecodeError
+# subclasses json.JSONDecodeError so existing except clauses keep working.
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _loads_json(text):
+    """Parse JSON text, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dump_json_file(data, filepath):
+    """Write ``data`` as indented JSON, using orjson when it is installed.
+
+    Datetimes and other non-JSON values go through ``str`` either way, so
+    both paths produce the same values.
+    """
+    if HAS_ORJSON:
+        options = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_NON_STR_KEYS
+        )
+        with open(filepath, "wb") as f:
+            f.write(orjson.dumps(data, default=str, option=options))
+        return
+    with open(filepath, "w") as f:
+        json.dump(data, f, indent=2, default=str)
+
+
+def _parse_json_if_str(value):
+    """Return value parsed as JSON if it is a string, otherwise unchanged."""
+    if isinstance(value, (str, bytes)):
+        return _loads_json(value)
+    return value
+
+
+def _preparse_analysis_json(value):
+    """Parse stored analysis JSON, including nested article/insight stages, up front.
+
+    Anything that fails to parse is returned as the original string so the
+    PDF renderer can still report the format error at that point.
+    """
+    if not value:
+        return value
+    try:
+        parsed = _parse_json_if_str(value)
+    except (ValueError, TypeError):
+        return value
+    if not isinstance(parsed, dict):
+        return value
+    for stage in ("article_analysis", "insight_analysis"):
+        if stage in parsed:
+            try:
+                stage_data = _parse_json_if_str(parsed[stage])
+            except (ValueError, TypeError):
+                continue
+            if isinstance(stage_data, dict):
+                parsed[stage] = stage_data
+    return parsed
+
+
+# Vertical gaps used between items by the analysis renderers. Each use still
+# builds its own Spacer: the doc template marks flowables that are pushed to
+# the next frame, so a shared instance would be reported as too large the
+# second time it lands at the bottom of a page.
+_PDF_TINY_SPACE = 0.03 * inch
+_PDF_SMALL_SPACE = 0.05 * inch
+_PDF_MEDIUM_SPACE = 0.1 * inch
+
+# Markup templates for the JSON renderers; section anchors are referenced by
+# the table of contents as "<article_id>_section_<n>".
+_SECTION_HEADING_TEMPLATE = '<a name="%s_section_%d"/>%s %s'
+_NUMBERED_ITEM_TEMPLATE = "%s %s"
+_LABELLED_VALUE_TEMPLATE = "%s: %s"
+_SOURCE_DETAIL_TEMPLATE = "%s <b>%s:</b> %s"
+_LINKED_SOURCE_DETAIL_TEMPLATE = "%s <b><link href='%s' color='blue'>%s</link>:</b> %s"
+_SOURCE_TEMPLATE = "%s <b>%s</b>"
+_LINKED_SOURCE_TEMPLATE = "%s <b><link href='%s' color='blue'>%s</link></b>"
+
+
+def _section_heading_markup(article_id: str, section_counter: int, title: str) -> str:
+    """Return the anchored, numbered heading markup for a top-level section."""
+    return _SECTION_HEADING_TEMPLATE % (
+        article_id,
+        section_counter,
+        _legal_section_number(1, section_counter),
+        title,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _display_key(key: str) -> str:
+    """Turn a JSON field name such as "prosecuting_agency" into "Prosecuting Agency"."""
+    return key.replace("_", " ").title()
+
+
+# Fact pattern subsections rendered by the article JSON renderer, in order:
+# (candidate keys, heading, trailing space). The first key present wins.
+_FACT_PATTERN_SECTIONS = (
+    (("parties",), "Parties Involved", _PDF_TINY_SPACE),
+    (("misconduct_details", "misconduct"), "Alleged Misconduct", _PDF_TINY_SPACE),
+    (("legal_framework",), "Legal Framework", _PDF_SMALL_SPACE),
+)
+
+# Stages of a two-stage analysis: (key, renderer method, parse error message).
+_ANALYSIS_STAGES = (
+    (
+        "article_analysis",
+        "_render_article_analysis_json_to_pdf",
+        "Article analysis format error.",
+    ),
+    (
+        "insight_analysis",
+        "_render_insight_analysis_json_to_pdf",
+        "Insight analysis format error.",
+    ),
+)
+
+# Insight dictionaries are headed by the first matching (heading, detail) pair.
+_INSIGHT_HEAD_KEYS = (
+    ("trend", "detail"),
+    ("prediction", "detail"),
+    ("stakeholder", "recommendation"),
+)
+
+# Markdown line prefixes and the renderer method that handles them. Lines are
+# looked up by their first four, three, then two characters.
+_MARKDOWN_LINE_HANDLERS = {
+    "####": "_render_markdown_subsubheading",
+    "###": "_render_markdown_subheading",
+    "##": "_render_markdown_heading",
+    "- ": "_render_markdown_bullet",
+    "* ": "_render_markdown_bullet",
+    "**": "_render_markdown_bold_line",
+    "---": "_render_markdown_rule",
+}
+
+# Markdown "##" headings containing one of these titles are numbered and bookmarked.
+_MAIN_SECTION_RE = re.compile(
+    "EXECUTIVE SUMMARY|CASE ANALYSIS|MARKET INTELLIGENCE|BLOG POST OUTLINE"
+)
+
+# Concatenated "•" items starting with one of these are rendered as sub-bullets.
+_CONCATENATED_SUB_BULLET_PREFIXES = (
+    "Majority-owned",
+    "DOJ Civil",
+    "U.S. Attorney",
+    "Small Business Administration",
+    "GNGH2 Inc.",
+)
+
+# Numbered list item with bold text (e.g., "1. **Case Name:**")
+_NUMBERED_BOLD_RE = re.compile(r"^\d+\.\s+\*\*.*\*\*")
+
+
+def _markdown_line_handler(line: str) -> Optional[str]:
+    """Return the renderer method name for a stripped markdown line.
+
+    Blank lines and the redundant source article line (already shown in
+    Article Information) map to ``None`` and are skipped.
+    """
+    if not line or "SOURCE ARTICLE:" in line:
+        return None
+    return (
+        _MARKDOWN_LINE_HANDLERS.get(line[:4])
+        or _MARKDOWN_LINE_HANDLERS.get(line[:3])
+        or _MARKDOWN_LINE_HANDLERS.get(line[:2])
+        or "_render_markdown_text_line"
+    )
+
+
+# Regulatory intelligence subsections: (key, heading).
+_REGULATORY_INTELLIGENCE_SECTIONS = (
+    ("agency_guidance", "Agency Guidance"),
+    ("congressional_activity", "Congressional Activity"),
+    ("industry_responses", "Industry Responses"),
+)
+
+_MARKET_IMPACT_CATEGORIES = ("stock_responses", "insurance_risk", "compliance_market")
+
+# Legal analysis subsections: (key, heading, trailing space).
+_LEGAL_ANALYSIS_SECTIONS = (
+    ("enforcement_trends", "Enforcement Trends & Precedent", _PDF_TINY_SPACE),
+    ("investigative_techniques", "Investigative Techniques", _PDF_TINY_SPACE),
+    ("whistleblower_analysis", "Whistleblower Analysis", _PDF_SMALL_SPACE),
+)
+
+_ROMAN_NUMERALS = (
+    (1000, "M"),
+    (900, "CM"),
+    (500, "D"),
+    (400, "CD"),
+    (100, "C"),
+    (90, "XC"),
+    (50, "L"),
+    (40, "XL"),
+    (10, "X"),
+    (9, "IX"),
+    (5, "V"),
+    (4, "IV"),
+    (1, "I"),
+)
+
+
+def _int_to_roman(num: int) -> str:
+    """Convert integer to Roman numeral."""
+    result = ""
+    for value, literal in _ROMAN_NUMERALS:
+        count = num // value
+        result += literal * count
+        num -= value * count
+    return result
+
+
+@lru_cache(maxsize=16)
+def _with_extra_space_after(style, extra: float):
+    """Return a copy of a paragraph style with extra points added to spaceAfter.
+
+    A Spacer following a paragraph adds its height to the paragraph's
+    spaceAfter, so this style gives the same layout with one flowable less.
+    """
+    return ParagraphStyle(
+        f"{style.name}+{extra:g}",
+        parent=style,
+        spaceAfter=style.spaceAfter + extra,
+    )
+
+
+def _compute_legal_section_number(level: int, counter: int) -> str:
+    """Generate legal document section numbers: 1., A., 1., a., i."""
+    if level == 2:  # Sub-sections: A., B., C.
+        return f"{chr(64 + counter)}."  # A=65, so 64+1=65=A
+    elif level == 4:  # Sub-sub-sub-sections: a., b., c.
+        return f"{chr(96 + counter)}."  # a=97, so 96+1=97=a
+    elif level == 5:  # Lowest level: i., ii., iii.
+        return _int_to_roman(counter).lower() + "."
+    # Main sections and sub-sub-sections (levels 1 and 3): 1., 2., 3.
+    return f"{counter}."
+
+
+# Section labels are requested once per rendered bullet, so the counters that
+# actually occur in reports are looked up from a precomputed table.
+_LEGAL_SECTION_LABEL_LIMIT = 64
+_LEGAL_SECTION_LABELS = {
+    level: tuple(
+        _compute_legal_section_number(level, counter)
+        for counter in range(_LEGAL_SECTION_LABEL_LIMIT)
+    )
+    for level in range(1, 6)
+}
+
+
+def _legal_section_number(level: int, counter: int) -> str:
+    """Return the legal section label for counter at the given nesting level."""
+    labels = _LEGAL_SECTION_LABELS.get(level)
+    if labels is not None and 0 <= counter < _LEGAL_SECTION_LABEL_LIMIT:
+        return labels[counter]
+    return _compute_legal_section_number(level, counter)
+
+
+# Dictionary of Unicode characters to ASCII replacements
+_PDF_UNICODE_REPLACEMENTS = {
+    "\u2011": "-",  # Non-breaking hyphen → regular hyphen
+    "\u2012": "-",  # Figure dash → regular hyphen
+    "\u2013": "-",  # En dash → regular hyphen
+    "\u2014": "--",  # Em dash → double hyphen
+    "\u2015": "--",  # Horizontal bar → double hyphen
+    "\u2018": "'",  # Left single quotation mark → apostrophe
+    "\u2019": "'",  # Right single quotation mark → apostrophe
+    "\u201A": "'",  # Single low-9 quotation mark → apostrophe
+    "\u201B": "'",  # Single high-reversed-9 quotation mark → apostrophe
+    "\u201C": '"',  # Left double quotation mark → quote
+    "\u201D": '"',  # Right double quotation mark → quote
+    "\u201E": '"',  # Double low-9 quotation mark → quote
+    "\u201F": '"',  # Double high-reversed-9 quotation mark → quote
+    "\u2026": "...",  # Horizontal ellipsis → three dots
+    "\u2032": "'",  # Prime → apostrophe
+    "\u2033": '"',  # Double prime → quote
+    "\u2039": "<",  # Single left-pointing angle quotation mark
+    "\u203A": ">",  # Single right-pointing angle quotation mark
+    "\u00A0": " ",  # Non-breaking space → regular space
+    "\u00AD": "",  # Soft hyphen → remove
+}
+
+
+# Translation table so all replacements are applied in a single pass
+_PDF_UNICODE_TRANSLATION = str.maketrans(_PDF_UNICODE_REPLACEMENTS)
+
+_MARKDOWN_BOLD_RE = re.compile(r"\*\*(.*?)\*\*")
+_MARKDOWN_ITALIC_RE = re.compile(r"\*(.*?)\*")
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_MULTIPLE_SOURCES_RE = re.compile(r"\[([^]]*https?://[^]]*)\]")
+
+# Link, bold and italic tags produced above are kept verbatim; any other &, <
+# or > is escaped. One alternation handles both in a single scan of the text.
+_PDF_ESCAPE_RE = re.compile(r"(<link[^>]*>.*?</link>|<b>.*?</b>|<i>.*?</i>)|[&<>]")
+_PDF_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+
+
+def _escape_pdf_match(match) -> str:
+    """Return a preserved tag unchanged or the entity for an escaped character."""
+    return match.group(1) or _PDF_ESCAPES[match.group(0)]
+
+
+def _normalize_unicode_for_pdf(text: str) -> str:
+    """Normalize Unicode characters to ASCII equivalents for better PDF compatibility."""
+    if not text:
+        return text
+
+    return text.translate(_PDF_UNICODE_TRANSLATION)
+
+
+def _format_multiple_sources(match) -> str:
+    """Format a bracketed "Name: URL, Name: URL" citation list as PDF links."""
+    sources_text = match.group(1)
+    # Split by comma and format each source
+    sources = sources_text.split(", ")
+    formatted_sources = []
+    for source in sources:
+        if ":" in source and "http" in source:
+            parts = source.split(": ", 1)
+            if len(parts) == 2:
+                name, url = parts
+                formatted_sources.append(
+                    f'<link href="{url.strip()}" color="blue">{name.strip()}</link>'
+                )
+            else:
+                formatted_sources.append(source)
+        else:
+            formatted_sources.append(source)
+    return "[" + ", ".join(formatted_sources) + "]"
+
+
+def _clean_text_for_pdf_uncached(text: str) -> str:
+    """Clean and format text for PDF generation."""
+    if not text:
+        return ""
+
+    # Normalize Unicode characters to ASCII equivalents for better PDF compatibility
+    text = _normalize_unicode_for_pdf(text)
+
+    # Convert markdown bold to HTML bold
+    text = _MARKDOWN_BOLD_RE.sub(r"<b>\1</b>", text)
+
+    # Convert markdown italic to HTML italic
+    text = _MARKDOWN_ITALIC_RE.sub(r"<i>\1</i>", text)
+
+    # Convert markdown links to HTML links with blue color
+    text = _MARKDOWN_LINK_RE.sub(r'<link href="\2" color="blue">\1</link>', text)
+
+    # Handle multiple source citations - convert to proper links
+    text = _MULTIPLE_SOURCES_RE.sub(_format_multiple_sources, text)
+
+    # Escape problematic characters while leaving our own tags intact
+    return _PDF_ESCAPE_RE.sub(_escape_pdf_match, text)
+
+
+# Speaker names, statutes, agency names and section keys repeat heavily across a
+# report, so cleaned strings are memoized; the cleaning itself is deterministic.
+_clean_text_for_pdf_cached = lru_cache(maxsize=8192)(_clean_text_for_pdf_uncached)
+
+# Longer texts (summaries, details, paragraphs) are effectively unique, so they
+# bypass the cache instead of evicting the short strings that do repeat.
+_CLEAN_TEXT_CACHE_MAX_LENGTH = 512
+
+_TRAILING_URL_PUNCTUATION_RE = re.compile(r'[\'"\]\)]+$')
+
+
+@lru_cache(maxsize=4096)
+def _clean_url_for_link(url: str) -> str:
+    """Clean URL for use in PDF links, removing trailing quotes and whitespace.
+
+    The same citation URLs recur across insight bullets, regulatory items and
+    comparable cases, so results are memoized.
+    """
+    # Remove any trailing quotes, brackets, or other non-URL characters
+    cleaned = url.strip()
+    # Remove trailing punctuation that's not part of the URL
+    cleaned = _TRAILING_URL_PUNCTUATION_RE.sub("", cleaned)
+    return cleaned.strip()
+
+
+class _PlainTextLine(Flowable):
+    """A markup-free line of text drawn directly, without Paragraph parsing.
+
+    Lays out exactly like a one-line Paragraph in the same style. If the text
+    turns out not to fit on one line at wrap time, it defers to a Paragraph so
+    wrapping and splitting behave as before.
+    """
+
+    def __init__(self, text: str, style):
+        Flowable.__init__(self)
+        self.text = text
+        self.style = style
+        self._paragraph = None
+
+    def wrap(self, availWidth, availHeight):
+        style = self.style
+        max_width = (
+            availWidth - style.leftIndent - style.rightIndent - style.firstLineIndent
+        )
+        text_width = stringWidth(self.text, style.fontName, style.fontSize)
+        if text_width > max_width - 0.01:
+            if self._paragraph is None:
+                self._paragraph = Paragraph(self.text, style)
+            return self._paragraph.wrap(availWidth, availHeight)
+
+        self._paragraph = None
+        self.width = availWidth
+        self.height = style.leading
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        if self._paragraph is None:
+            return []
+        return self._paragraph.split(availWidth, availHeight)
+
+    def drawOn(self, canvas, x, y, _sW=0):
+        if self._paragraph is not None:
+            return self._paragraph.drawOn(canvas, x, y, _sW)
+        return Flowable.drawOn(self, canvas, x, y, _sW)
+
+    def draw(self):
+        style = self.style
+        self.canv.setFont(style.fontName, style.fontSize)
+        self.canv.setFillColor(style.textColor)
+        self.canv.drawString(
+            style.leftIndent + style.firstLineIndent,
+            self.height - style.fontSize,
+            self.text,
+        )
+
+
+def _text_flowable(text: str, style):
+    """Return a _PlainTextLine for markup-free text, otherwise a Paragraph."""
+    if "<" in text or "&" in text or style.alignment not in (TA_LEFT, TA_JUSTIFY):
+        return Paragraph(text, style)
+    text = " ".join(text.split())
+    if not text:
+        return Paragraph(text, style)
+    return _PlainTextLine(text, style)
+
 
 class ReportGenerator:
     """Generates reports in various formats."""
@@ -192,8 +644,7 @@ class ReportGenerator:
             "articles": articles,
         }
 
-        with open(filepath, "w") as f:
-            json.dump(report_data, f, indent=2, default=str)
+        _dump_json_file(report_data, filepath)
 
     def _generate_html(self, report: Report, articles: List[Dict], filepath: Path):
         """Generate HTML report."""
@@ -1040,6 +1491,10 @@ class ReportGenerator:
                         "detailed_analysis_json": article.get(
                             "detailed_analysis_json", ""
                         ),
+                        # Parsed once here so rendering works on dicts
+                        "detailed_analysis_data": _preparse_analysis_json(
+                            article.get("detailed_analysis_json", "")
+                        ),
                     }
                 )
         
@@ -1063,7 +1518,7 @@ class ReportGenerator:
                     story.append(Paragraph(entry, toc_sub_style))
                 else:  # Main section
                     story.append(Paragraph(entry, toc_style))
-            story.append(Spacer(1, 0.1 * inch))  # Reduced spacing
+            story.append(Spacer(1, _PDF_MEDIUM_SPACE))  # Reduced spacing
 
         # Report metadata with bookmark
         story.append(
@@ -1083,7 +1538,7 @@ class ReportGenerator:
         story.append(
             Paragraph(f"<b>AI Tokens Used:</b> {report.tokens_used:,}", metadata_style)
         )
-        story.append(Spacer(1, 0.1 * inch))  # Reduced spacing
+        story.append(Spacer(1, _PDF_MEDIUM_SPACE))  # Reduced spacing
 
         # Summary - Keep on first page with bookmark
         if report.summary:
@@ -1093,7 +1548,7 @@ class ReportGenerator:
             story.append(
                 Paragraph(self._clean_text_for_pdf(report.summary), body_style)
             )
-            story.append(Spacer(1, 0.1 * inch))  # Reduced spacing
+            story.append(Spacer(1, _PDF_MEDIUM_SPACE))  # Reduced spacing
 
         # Articles with Detailed Analysis List with links and bookmark
         if articles_with_analysis:
@@ -1117,7 +1572,7 @@ class ReportGenerator:
                     body_style,
                 )
             )
-            story.append(Spacer(1, 0.05 * inch))  # Reduced spacing
+            story.append(Spacer(1, _PDF_SMALL_SPACE))  # Reduced spacing
 
             for i, article_info in enumerate(articles_with_analysis, 1):
                 title = article_info["title"]
@@ -1126,7 +1581,7 @@ class ReportGenerator:
                 link_text = f"<b>{i}.</b> <link href='{url}' color='blue'>{self._clean_text_for_pdf(title)}</link> (Score: {score})"
                 story.append(Paragraph(link_text, legal_level1_style))
 
-            story.append(Spacer(1, 0.1 * inch))
+            story.append(Spacer(1, _PDF_MEDIUM_SPACE))
             story.append(
                 Paragraph(
                     "Detailed analysis of each article begins on the next page.",
@@ -1148,7 +1603,7 @@ class ReportGenerator:
             article_id = f"article_{i+1}"
             title_with_link = f'<a name="{article_id}"/><link href="{url}" color="blue">{self._clean_text_for_pdf(title)}</link>'
             story.append(Paragraph(title_with_link, subheading_style))
-            story.append(Spacer(1, 0.05 * inch))  # Reduced spacing
+            story.append(Spacer(1, _PDF_SMALL_SPACE))  # Reduced spacing
 
             # Article information section
             story.append(Paragraph("Article Information", heading_style))
@@ -1203,7 +1658,7 @@ class ReportGenerator:
                     )
                 )
 
-            story.append(Spacer(1, 0.1 * inch))  # Reduced spacing
+            story.append(Spacer(1, _PDF_MEDIUM_SPACE))  # Reduced spacing
 
             # Detailed blog outline
             detailed_analysis_json = article_info.get("detailed_analysis_json")
@@ -1213,7 +1668,7 @@ class ReportGenerator:
             if detailed_analysis_json:
                 print(f"Using JSON: {article_info['title']}...")
                 self._render_json_analysis_to_pdf(
-                    detailed_analysis_json,
+                    article_info["detailed_analysis_data"],
                     story,
                     heading_style,
                     subheading_style,
@@ -1256,6 +1711,10 @@ class ReportGenerator:
                         i,
                     )
 
+            # The story now holds this article's rendered analysis; drop the
+            # parsed copy so it doesn't stay alive until the build
+            article_info.pop("detailed_analysis_data", None)
+
         # === APPENDIX ===
         if (
             articles_with_analysis
@@ -1386,7 +1845,7 @@ class ReportGenerator:
 
             elif line.startswith("---"):
                 # Horizontal rules - add some space
-                story.append(Spacer(1, 0.1 * inch))
+                story.append(Spacer(1, _PDF_MEDIUM_SPACE))
 
             elif line and not line.startswith("#"):
                 # Regular text paragraphs
@@ -1394,107 +1853,15 @@ class ReportGenerator:
 
     def _clean_text_for_pdf(self, text: str) -> str:
         """Clean and format text for PDF generation."""
-        import re
-
-        if not text:
+        if not text or (isinstance(text, str) and text.isspace()):
             return ""
-
-        # Normalize Unicode characters to ASCII equivalents for better PDF compatibility
-        text = self._normalize_unicode_for_pdf(text)
-
-        # Convert markdown bold to HTML bold
-        text = re.sub(r"\*\*(.*?)\*\*", r"<b>\1</b>", text)
-
-        # Convert markdown italic to HTML italic
-        text = re.sub(r"\*(.*?)\*", r"<i>\1</i>", text)
-
-        # Convert markdown links to HTML links with blue color
-        text = re.sub(
-            r"\[([^\]]+)\]\(([^)]+)\)", r'<link href="\2" color="blue">\1</link>', text
-        )
-
-        # Handle multiple source citations - convert to proper links
-        def format_multiple_sources(match):
-            sources_text = match.group(1)
-            # Split by comma and format each source
-            sources = sources_text.split(", ")
-            formatted_sources = []
-            for source in sources:
-                if ":" in source and "http" in source:
-                    parts = source.split(": ", 1)
-                    if len(parts) == 2:
-                        name, url = parts
-                        formatted_sources.append(
-                            f'<link href="{url.strip()}" color="blue">{name.strip()}</link>'
-                        )
-                    else:
-                        formatted_sources.append(source)
-                else:
-                    formatted_sources.append(source)
-            return "[" + ", ".join(formatted_sources) + "]"
-
-        # Apply multiple source formatting
-        text = re.sub(r"\[([^]]*https?://[^]]*)\]", format_multiple_sources, text)
-
-        # First, preserve our HTML tags temporarily
-        import uuid
-
-        tag_placeholders = {}
-
-        # Preserve link tags completely
-        def preserve_tag(match):
-            placeholder = f"TAGPRESERVE{uuid.uuid4().hex[:8]}"
-            tag_placeholders[placeholder] = match.group(0)
-            return placeholder
-
-        text = re.sub(r"<link[^>]*>.*?</link>", preserve_tag, text)
-        text = re.sub(r"<b>.*?</b>", preserve_tag, text)
-        text = re.sub(r"<i>.*?</i>", preserve_tag, text)
-
-        # Now escape problematic characters
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;").replace(">", "&gt;")
-
-        # Restore preserved tags
-        for placeholder, original_tag in tag_placeholders.items():
-            text = text.replace(placeholder, original_tag)
-
-        return text
+        if isinstance(text, str) and len(text) < _CLEAN_TEXT_CACHE_MAX_LENGTH:
+            return _clean_text_for_pdf_cached(text)
+        return _clean_text_for_pdf_uncached(text)
 
     def _normalize_unicode_for_pdf(self, text: str) -> str:
         """Normalize Unicode characters to ASCII equivalents for better PDF compatibility."""
-        if not text:
-            return text
-
-        # Dictionary of Unicode characters to ASCII replacements
-        unicode_replacements = {
-            "\u2011": "-",  # Non-breaking hyphen → regular hyphen
-            "\u2012": "-",  # Figure dash → regular hyphen
-            "\u2013": "-",  # En dash → regular hyphen
-            "\u2014": "--",  # Em dash → double hyphen
-            "\u2015": "--",  # Horizontal bar → double hyphen
-            "\u2018": "'",  # Left single quotation mark → apostrophe
-            "\u2019": "'",  # Right single quotation mark → apostrophe
-            "\u201A": "'",  # Single low-9 quotation mark → apostrophe
-            "\u201B": "'",  # Single high-reversed-9 quotation mark → apostrophe
-            "\u201C": '"',  # Left double quotation mark → quote
-            "\u201D": '"',  # Right double quotation mark → quote
-            "\u201E": '"',  # Double low-9 quotation mark → quote
-            "\u201F": '"',  # Double high-reversed-9 quotation mark → quote
-            "\u2026": "...",  # Horizontal ellipsis → three dots
-            "\u2032": "'",  # Prime → apostrophe
-            "\u2033": '"',  # Double prime → quote
-            "\u2039": "<",  # Single left-pointing angle quotation mark
-            "\u203A": ">",  # Single right-pointing angle quotation mark
-            "\u00A0": " ",  # Non-breaking space → regular space
-            "\u00AD": "",  # Soft hyphen → remove
-        }
-
-        # Apply replacements
-        for unicode_char, replacement in unicode_replacements.items():
-            text = text.replace(unicode_char, replacement)
-
-        return text
+        return _normalize_unicode_for_pdf(text)
 
     def _clean_unreachable_code_placeholder(self):
         """Placeholder method - the code below was unreachable after return statement."""
@@ -1631,15 +1998,9 @@ class ReportGenerator:
 
     def _clean_url_for_link(self, url: str) -> str:
         """Clean URL for use in PDF links, removing trailing quotes and whitespace."""
-        import re
-
         if not url:
             return ""
-        # Remove any trailing quotes, brackets, or other non-URL characters
-        cleaned = str(url).strip()
-        # Remove trailing punctuation that's not part of the URL
-        cleaned = re.sub(r'[\'"\]\)]+$', "", cleaned)
-        return cleaned.strip()
+        return _clean_url_for_link(str(url))
 
     def _extract_detailed_analysis_for_article(
         self, analysis_content: str, article_title: str
@@ -1933,7 +2294,7 @@ class ReportGenerator:
 
             elif line.startswith("---"):
                 # Horizontal rules - add some space
-                story.append(Spacer(1, 0.1 * inch))
+                story.append(Spacer(1, _PDF_MEDIUM_SPACE))
 
             elif line and (
                 ("**" in line and line.count("**") >= 2)
@@ -2098,9 +2459,6 @@ class ReportGenerator:
         if not table_data or len(table_data) < 2:
             return
 
-        from reportlab.platypus import Paragraph, Spacer
-        from reportlab.lib.units import inch
-
         # Skip header row, process data rows
         for row in table_data[1:]:
             if len(row) >= 2:
@@ -2132,11 +2490,11 @@ class ReportGenerator:
                         story.append(Paragraph(f"  • {detail_clean}", body_style))
 
                 # Add small spacing between elements
-                story.append(Spacer(1, 0.05 * inch))
+                story.append(Spacer(1, _PDF_SMALL_SPACE))
 
     def _render_json_analysis_to_pdf(
         self,
-        detailed_analysis_json: str,
+        detailed_analysis_json: Union[Dict, str],
         story: List,
         heading_style,
         subheading_style,
@@ -2148,80 +2506,43 @@ class ReportGenerator:
         legal_level4_style,
         article_id: str,
     ):
-        """Render JSON-structured analysis directly to PDF without markdown conversion."""
-        import json
-        from reportlab.platypus import Paragraph, Spacer
-        from reportlab.lib.units import inch
+        """Render JSON-structured analysis directly to PDF without markdown conversion.
+
+        Accepts either the stored JSON string or an already-parsed dict; the
+        nested article/insight stages are likewise only parsed when they are
+        still serialized strings.
+        """
+        render_styles = (
+            heading_style,
+            subheading_style,
+            body_style,
+            bullet_style,
+            legal_level1_style,
+            legal_level2_style,
+            legal_level3_style,
+            legal_level4_style,
+        )
 
         try:
             # Parse the combined JSON
-            combined_json = json.loads(detailed_analysis_json)
+            combined_json = _parse_json_if_str(detailed_analysis_json)
 
             # Check if this has both article and insight analysis
-            if (
-                "article_analysis" in combined_json
-                and "insight_analysis" in combined_json
-            ):
-                # Two-stage analysis
-                article_text = combined_json["article_analysis"]
-                insight_text = combined_json["insight_analysis"]
-
-                # Parse article analysis
-                try:
-                    article_json = json.loads(article_text)
-                    self._render_article_analysis_json_to_pdf(
-                        article_json,
-                        story,
-                        heading_style,
-                        subheading_style,
-                        body_style,
-                        bullet_style,
-                        legal_level1_style,
-                        legal_level2_style,
-                        legal_level3_style,
-                        legal_level4_style,
-                        article_id,
-                    )
-                except json.JSONDecodeError:
-                    story.append(
-                        Paragraph("Article analysis format error.", body_style)
-                    )
-
-                # Parse insight analysis
-                try:
-                    insight_json = json.loads(insight_text)
-                    self._render_insight_analysis_json_to_pdf(
-                        insight_json,
-                        story,
-                        heading_style,
-                        subheading_style,
-                        body_style,
-                        bullet_style,
-                        legal_level1_style,
-                        legal_level2_style,
-                        legal_level3_style,
-                        legal_level4_style,
-                        article_id,
-                    )
-                except json.JSONDecodeError:
-                    story.append(
-                        Paragraph("Insight analysis format error.", body_style)
+            if all(stage in combined_json for stage, _, _ in _ANALYSIS_STAGES):
+                # Two-stage analysis: parse and render each stage in turn
+                for stage, renderer_name, error_message in _ANALYSIS_STAGES:
+                    try:
+                        stage_json = _parse_json_if_str(combined_json[stage])
+                    except json.JSONDecodeError:
+                        story.append(Paragraph(error_message, body_style))
+                        continue
+                    getattr(self, renderer_name)(
+                        stage_json, story, *render_styles, article_id
                     )
-
             else:
                 # Single article analysis
                 self._render_article_analysis_json_to_pdf(
-                    combined_json,
-                    story,
-                    heading_style,
-                    subheading_style,
-                    body_style,
-                    bullet_style,
-                    legal_level1_style,
-                    legal_level2_style,
-                    legal_level3_style,
-                    legal_level4_style,
-                    article_id,
+                    combined_json, story, *render_styles, article_id
                 )
 
         except json.JSONDecodeError as e:
@@ -2247,71 +2568,31 @@ class ReportGenerator:
         article_id: str,
     ):
         """Render article analysis JSON to PDF."""
-        from reportlab.platypus import Paragraph, Spacer
-        from reportlab.lib.units import inch
-
         # Legal document section numbering
         section_counter = 0
 
-        def int_to_roman(num):
-            """Convert integer to Roman numeral."""
-            values = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
-            literals = [
-                "M",
-                "CM",
-                "D",
-                "CD",
-                "C",
-                "XC",
-                "L",
-                "XL",
-                "X",
-                "IX",
-                "V",
-                "IV",
-                "I",
-            ]
-            result = ""
-            for i in range(len(values)):
-                count = num // values[i]
-                result += literals[i] * count
-                num -= values[i] * count
-            return result
-
-        def get_legal_section_number(level, counter):
-            """Generate legal document section numbers: 1., A., 1., a., i."""
-            if level == 1:  # Main sections: 1., 2., 3.
-                return f"{counter}."
-            elif level == 2:  # Sub-sections: A., B., C.
-                return f"{chr(64 + counter)}."  # A=65, so 64+1=65=A
-            elif level == 3:  # Sub-sub-sections: 1., 2., 3.
-                return f"{counter}."
-            elif level == 4:  # Sub-sub-sub-sections: a., b., c.
-                return f"{chr(96 + counter)}."  # a=97, so 96+1=97=a
-            elif level == 5:  # Lowest level: i., ii., iii.
-                return int_to_roman(counter).lower() + "."
-            else:
-                return f"{counter}."
-
         # Executive Summary
         if "analysis_metadata" in article_json:
             metadata = article_json["analysis_metadata"]
             if "relevance_score" in metadata:
-                story.append(
-                    Paragraph(
-                        f"Relevance score: {metadata['relevance_score']}", body_style
+                story.extend(
+                    (
+                        Paragraph(
+                            f"Relevance score: {metadata['relevance_score']}",
+                            body_style,
+                        ),
+                        Spacer(1, _PDF_SMALL_SPACE),
                     )
                 )
-                story.append(Spacer(1, 0.05 * inch))
 
         if "case_overview" in article_json:
             overview = article_json["case_overview"]
             section_counter += 1
-            section_id = f"{article_id}_section_{section_counter}"
-            section_num = get_legal_section_number(1, section_counter)
             story.append(
                 Paragraph(
-                    f'<a name="{section_id}"/>{section_num} EXECUTIVE SUMMARY',
+                    _section_heading_markup(
+                        article_id, section_counter, "EXECUTIVE SUMMARY"
+                    ),
                     heading_style,
                 )
             )
@@ -2326,15 +2607,14 @@ class ReportGenerator:
                         self._clean_text_for_pdf(overview["significance"]), body_style
                     )
                 )
-            story.append(Spacer(1, 0.05 * inch))
+            story.append(Spacer(1, _PDF_SMALL_SPACE))
 
         # Case Analysis
         section_counter += 1
-        section_id = f"{article_id}_section_{section_counter}"
-        section_num = get_legal_section_number(1, section_counter)
         story.append(
             Paragraph(
-                f'<a name="{section_id}"/>{section_num} CASE ANALYSIS', heading_style
+                _section_heading_markup(article_id, section_counter, "CASE ANALYSIS"),
+                heading_style,
             )
         )
 
@@ -2342,134 +2622,32 @@ class ReportGenerator:
             fact_pattern = article_json["fact_pattern"]
             subsection_counter = 0
 
-            # Parties
-            if "parties" in fact_pattern:
-                subsection_counter += 1
-                subsection_num = get_legal_section_number(2, subsection_counter)
-                story.append(
-                    Paragraph(
-                        f"<b>{subsection_num} Parties Involved</b>", subheading_style
-                    )
-                )
-                parties = fact_pattern["parties"]
-                if isinstance(parties, dict):
-                    # Parse dictionary into numbered legal format
-                    for i, (key, value) in enumerate(parties.items(), 1):
-                        item_num = get_legal_section_number(3, i)
-                        # Capitalize the key for display
-                        display_key = key.replace("_", " ").title()
-                        story.append(
-                            Paragraph(
-                                f"{item_num} {display_key}: {self._clean_text_for_pdf(str(value))}",
-                                legal_level3_style,
-                            )
-                        )
-                elif isinstance(parties, list):
-                    for i, party in enumerate(parties, 1):
-                        party_num = get_legal_section_number(3, i)
-                        story.append(
-                            Paragraph(
-                                f"{party_num} {self._clean_text_for_pdf(str(party))}",
-                                legal_level3_style,
-                            )
-                        )
-                else:
-                    story.append(
-                        Paragraph(self._clean_text_for_pdf(str(parties)), body_style)
-                    )
-                story.append(Spacer(1, 0.03 * inch))
-
-            # Misconduct
-            if "misconduct_details" in fact_pattern:
-                subsection_counter += 1
-                subsection_num = get_legal_section_number(2, subsection_counter)
-                story.append(
-                    Paragraph(
-                        f"<b>{subsection_num} Alleged Misconduct</b>", subheading_style
-                    )
-                )
-                story.append(
-                    Paragraph(
-                        self._clean_text_for_pdf(fact_pattern["misconduct_details"]),
-                        body_style,
-                    )
-                )
-                story.append(Spacer(1, 0.03 * inch))
-            elif "misconduct" in fact_pattern:
+            # Parties, misconduct and legal framework share one layout
+            for keys, title, trailing_space in _FACT_PATTERN_SECTIONS:
+                key = next((k for k in keys if k in fact_pattern), None)
+                if key is None:
+                    continue
                 subsection_counter += 1
-                subsection_num = get_legal_section_number(2, subsection_counter)
+                subsection_num = _legal_section_number(2, subsection_counter)
                 story.append(
-                    Paragraph(
-                        f"<b>{subsection_num} Alleged Misconduct</b>", subheading_style
-                    )
+                    Paragraph(f"<b>{subsection_num} {title}</b>", subheading_style)
                 )
-                misconduct = fact_pattern["misconduct"]
-                if isinstance(misconduct, dict):
-                    for i, (key, value) in enumerate(misconduct.items(), 1):
-                        item_num = get_legal_section_number(3, i)
-                        # Capitalize the key for display
-                        display_key = key.replace("_", " ").title()
-                        story.append(
-                            Paragraph(
-                                f"{item_num} {display_key}: {self._clean_text_for_pdf(str(value))}",
-                                legal_level3_style,
-                            )
-                        )
-                elif isinstance(misconduct, list):
-                    for i, item in enumerate(misconduct, 1):
-                        item_num = get_legal_section_number(3, i)
-                        story.append(
-                            Paragraph(
-                                f"{item_num} {self._clean_text_for_pdf(str(item))}",
-                                legal_level3_style,
-                            )
-                        )
-                else:
-                    story.append(
-                        Paragraph(self._clean_text_for_pdf(str(misconduct)), body_style)
-                    )
-                story.append(Spacer(1, 0.03 * inch))
-
-            # Legal Framework
-            if "legal_framework" in fact_pattern:
-                subsection_counter += 1
-                subsection_num = get_legal_section_number(2, subsection_counter)
-                story.append(
-                    Paragraph(
-                        f"<b>{subsection_num} Legal Framework</b>", subheading_style
+                value = fact_pattern[key]
+                if isinstance(value, (dict, list)):
+                    # Parse dictionary or list into numbered legal format
+                    story.extend(
+                        self._numbered_item_paragraphs(value, legal_level3_style)
                     )
-                )
-                legal = fact_pattern["legal_framework"]
-                if isinstance(legal, list):
-                    for i, statute in enumerate(legal, 1):
-                        statute_num = get_legal_section_number(3, i)
-                        story.append(
-                            Paragraph(
-                                f"{statute_num} {self._clean_text_for_pdf(statute)}",
-                                legal_level3_style,
-                            )
-                        )
-                elif isinstance(legal, dict):
-                    for i, (key, value) in enumerate(legal.items(), 1):
-                        item_num = get_legal_section_number(3, i)
-                        # Capitalize the key for display
-                        display_key = key.replace("_", " ").title()
-                        story.append(
-                            Paragraph(
-                                f"{item_num} {display_key}: {self._clean_text_for_pdf(str(value))}",
-                                legal_level3_style,
-                            )
-                        )
                 else:
                     story.append(
-                        Paragraph(self._clean_text_for_pdf(str(legal)), body_style)
+                        Paragraph(self._clean_text_for_pdf(str(value)), body_style)
                     )
-                story.append(Spacer(1, 0.05 * inch))
+                story.append(Spacer(1, trailing_space))
 
         # Supporting Quotes
         if "supporting_quotes" in article_json:
             subsection_counter += 1
-            subsection_num = get_legal_section_number(2, subsection_counter)
+            subsection_num = _legal_section_number(2, subsection_counter)
             story.append(
                 Paragraph(
                     f"<b>{subsection_num} Supporting Quotes</b>", subheading_style
@@ -2477,9 +2655,18 @@ class ReportGenerator:
             )
 
             quotes = article_json["supporting_quotes"]
+            # Between consecutive quotes the gap is carried by spaceAfter
+            # instead of a Spacer; the last quote keeps its Spacer so the
+            # following heading's spaceBefore still adds on top of it.
+            spaced_quote_style = _with_extra_space_after(
+                legal_level3_style, _PDF_TINY_SPACE
+            )
+            last_quote = len(quotes)
             for i, quote in enumerate(quotes, 1):
-                quote_num = get_legal_section_number(3, i)
-                if isinstance(quote, dict):
+                quote_num = _legal_section_number(3, i)
+                # Decoded JSON only contains plain dicts, so item-level checks
+                # use an exact type test rather than isinstance
+                if type(quote) is dict:
                     quote_text = quote.get("quote", "")
                     speaker = quote.get("speaker", "Unknown")
                     title = quote.get("title", "")
@@ -2490,69 +2677,150 @@ class ReportGenerator:
                     quote_text = str(quote)
                     attribution = ""
 
-                story.append(
-                    Paragraph(
-                        f'{quote_num} <i>"{self._clean_text_for_pdf(quote_text)}"</i> {attribution}',
-                        legal_level3_style,
+                quote_markup = f'{quote_num} <i>"{self._clean_text_for_pdf(quote_text)}"</i> {attribution}'
+                if i < last_quote:
+                    story.append(Paragraph(quote_markup, spaced_quote_style))
+                else:
+                    story.extend(
+                        (
+                            Paragraph(quote_markup, legal_level3_style),
+                            Spacer(1, _PDF_TINY_SPACE),
+                        )
                     )
-                )
-                story.append(Spacer(1, 0.03 * inch))
 
         # Legal Analysis
         if "legal_analysis" in article_json:
             analysis = article_json["legal_analysis"]
             analysis_section_counter = 0
 
-            if "enforcement_trends" in analysis:
+            for key, title, trailing_space in _LEGAL_ANALYSIS_SECTIONS:
+                if key not in analysis:
+                    continue
                 analysis_section_counter += 1
-                analysis_num = get_legal_section_number(
+                analysis_num = _legal_section_number(
                     2, subsection_counter + analysis_section_counter
                 )
-                story.append(
-                    Paragraph(
-                        f"<b>{analysis_num} Enforcement Trends & Precedent</b>",
-                        subheading_style,
+                story.extend(
+                    (
+                        Paragraph(f"<b>{analysis_num} {title}</b>", subheading_style),
+                        Paragraph(
+                            self._clean_text_for_pdf(str(analysis[key])), body_style
+                        ),
+                        Spacer(1, trailing_space),
                     )
                 )
-                trends = analysis["enforcement_trends"]
-                story.append(
-                    Paragraph(self._clean_text_for_pdf(str(trends)), body_style)
-                )
-                story.append(Spacer(1, 0.03 * inch))
 
-            if "investigative_techniques" in analysis:
-                analysis_section_counter += 1
-                analysis_num = get_legal_section_number(
-                    2, subsection_counter + analysis_section_counter
-                )
-                story.append(
-                    Paragraph(
-                        f"<b>{analysis_num} Investigative Techniques</b>",
-                        subheading_style,
-                    )
-                )
-                techniques = analysis["investigative_techniques"]
-                story.append(
-                    Paragraph(self._clean_text_for_pdf(str(techniques)), body_style)
-                )
-                story.append(Spacer(1, 0.03 * inch))
+    def _numbered_item_paragraphs(self, items, style) -> List:
+        """Build level-3 numbered flowables for a list or a dict of labelled values.
 
-            if "whistleblower_analysis" in analysis:
-                analysis_section_counter += 1
-                analysis_num = get_legal_section_number(
-                    2, subsection_counter + analysis_section_counter
-                )
-                story.append(
+        Each item keeps its own flowable so the hanging indent of the legal
+        numbering styles applies to every entry.
+        """
+        if isinstance(items, dict):
+            # Capitalize the key for display
+            texts = [
+                _LABELLED_VALUE_TEMPLATE
+                % (_display_key(key), self._clean_text_for_pdf(str(value)))
+                for key, value in items.items()
+            ]
+        else:
+            texts = [self._clean_text_for_pdf(str(item)) for item in items]
+        return [
+            _text_flowable(
+                _NUMBERED_ITEM_TEMPLATE % (_legal_section_number(3, i), text), style
+            )
+            for i, text in enumerate(texts, 1)
+        ]
+
+    def _format_insight_item(self, item: dict) -> str:
+        """Format an insight dictionary as a bold heading, detail and citation link."""
+        has_citation = "source" in item and "source_url" in item
+
+        # Extract meaningful content from dictionary with citations
+        for head_key, detail_key in _INSIGHT_HEAD_KEYS:
+            if head_key in item and detail_key in item:
+                formatted_text = f"<b>{item[head_key]}:</b> {item[detail_key]}"
+                break
+        else:
+            # Generic dictionary handling - everything except the citation
+            formatted_text = " - ".join(
+                [
+                    f"{k}: {v}"
+                    for k, v in item.items()
+                    if k not in ["source", "source_url"]
+                ]
+            )
+
+        # Add citation if available
+        if has_citation:
+            clean_url = self._clean_url_for_link(item["source_url"])
+            formatted_text += (
+                f" (<link href='{clean_url}' color='blue'>{item['source']}</link>)"
+            )
+        return formatted_text
+
+    def _format_source_detail_item(self, item_letter: str, item: dict) -> str:
+        """Format a ``{source, detail, source_url}`` dictionary as a lettered item.
+
+        Items without any detail text render just the (linked) source, with no
+        trailing colon.
+        """
+        source = self._clean_text_for_pdf(item.get("source", "Unknown"))
+        # Try both 'detail' and 'details'
+        details = self._clean_text_for_pdf(
+            item.get("detail") or item.get("details", "")
+        )
+        source_url = item.get("source_url", "")
+
+        # Format with hyperlink if URL available
+        if source_url:
+            clean_url = self._clean_url_for_link(source_url)
+            if not details:
+                return _LINKED_SOURCE_TEMPLATE % (item_letter, clean_url, source)
+            return _LINKED_SOURCE_DETAIL_TEMPLATE % (
+                item_letter,
+                clean_url,
+                source,
+                details,
+            )
+        if not details:
+            return _SOURCE_TEMPLATE % (item_letter, source)
+        return _SOURCE_DETAIL_TEMPLATE % (item_letter, source, details)
+
+    def _source_detail_item_flowables(
+        self, items, style, include_plain_items: bool = False
+    ) -> List:
+        """Build lettered flowables for a list of source/detail/source_url items.
+
+        Non-dictionary items are skipped unless ``include_plain_items`` is set,
+        in which case they are rendered as plain text. Anything other than a
+        list produces no flowables.
+        """
+        if not isinstance(items, list):
+            return []
+        flowables = []
+        for i, item in enumerate(items, 1):
+            if type(item) is dict:
+                flowables.append(
                     Paragraph(
-                        f"<b>{analysis_num} Whistleblower Analysis</b>",
-                        subheading_style,
+                        self._format_source_detail_item(
+                            _legal_section_number(4, i), item
+                        ),
+                        style,
                     )
                 )
-                whistleblower = analysis["whistleblower_analysis"]
-                story.append(
-                    Paragraph(self._clean_text_for_pdf(str(whistleblower)), body_style)
+            elif include_plain_items:
+                flowables.append(
+                    _text_flowable(
+                        _NUMBERED_ITEM_TEMPLATE
+                        % (
+                            _legal_section_number(4, i),
+                            self._clean_text_for_pdf(str(item)),
+                        ),
+                        style,
+                    )
                 )
-                story.append(Spacer(1, 0.05 * inch))
+        return flowables
 
     def _render_insight_analysis_json_to_pdf(
         self,
@@ -2569,64 +2837,27 @@ class ReportGenerator:
         article_id: str,
     ):
         """Render insight analysis JSON to PDF."""
-        from reportlab.platypus import Paragraph, Spacer
-        from reportlab.lib.units import inch
-
-        # Helper functions for legal numbering (redefine here for scope)
-        def int_to_roman(num):
-            values = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
-            literals = [
-                "M",
-                "CM",
-                "D",
-                "CD",
-                "C",
-                "XC",
-                "L",
-                "XL",
-                "X",
-                "IX",
-                "V",
-                "IV",
-                "I",
-            ]
-            result = ""
-            for i in range(len(values)):
-                count = num // values[i]
-                result += literals[i] * count
-                num -= values[i] * count
-            return result
-
-        def get_legal_section_number(level, counter):
-            if level == 1:  # Main sections: 1., 2., 3.
-                return f"{counter}."
-            elif level == 2:  # Sub-sections: A., B., C.
-                return f"{chr(64 + counter)}."
-            elif level == 3:  # Sub-sub-sections: 1., 2., 3.
-                return f"{counter}."
-            elif level == 4:  # Sub-sub-sub-sections: a., b., c.
-                return f"{chr(96 + counter)}."
-            elif level == 5:  # Lowest level: i., ii., iii.
-                return int_to_roman(counter).lower() + "."
-            else:
-                return f"{counter}."
-
         # Market Intelligence section (continuing from Case Analysis)
         # Create proper anchor using the passed article_id
-        section_id = f"{article_id}_section_3"
         story.append(
             Paragraph(
-                f'<a name="{section_id}"/>3. MARKET INTELLIGENCE & EXTERNAL RESEARCH',
+                _section_heading_markup(
+                    article_id, 3, "MARKET INTELLIGENCE & EXTERNAL RESEARCH"
+                ),
                 heading_style,
             )
         )
 
         # Research Summary
         if "research_summary" in insight_json:
-            story.append(Paragraph("<b>A. Research Summary</b>", subheading_style))
             summary = insight_json["research_summary"]
-            story.append(Paragraph(self._clean_text_for_pdf(str(summary)), body_style))
-            story.append(Spacer(1, 0.05 * inch))
+            story.extend(
+                (
+                    Paragraph("<b>A. Research Summary</b>", subheading_style),
+                    Paragraph(self._clean_text_for_pdf(str(summary)), body_style),
+                    Spacer(1, _PDF_SMALL_SPACE),
+                )
+            )
 
         # Insights
         if "insights" in insight_json:
@@ -2636,61 +2867,17 @@ class ReportGenerator:
                 subsection_counter = 0
                 for key, value in insights.items():
                     subsection_counter += 1
-                    sub_num = get_legal_section_number(3, subsection_counter)
-                    key_title = key.replace("_", " ").title()
+                    sub_num = _legal_section_number(3, subsection_counter)
+                    key_title = _display_key(key)
                     story.append(Paragraph(f"<b>{sub_num} {key_title}</b>", body_style))
 
                     if isinstance(value, list):
                         for i, item in enumerate(value, 1):
-                            item_letter = get_legal_section_number(4, i)
+                            item_letter = _legal_section_number(4, i)
 
                             # Handle both dictionary and string items
-                            if isinstance(item, dict):
-                                # Extract meaningful content from dictionary with citations
-                                if "trend" in item and "detail" in item:
-                                    formatted_text = (
-                                        f"<b>{item['trend']}:</b> {item['detail']}"
-                                    )
-                                    # Add citation if available
-                                    if "source" in item and "source_url" in item:
-                                        clean_url = self._clean_url_for_link(
-                                            item["source_url"]
-                                        )
-                                        formatted_text += f" (<link href='{clean_url}' color='blue'>{item['source']}</link>)"
-                                elif "prediction" in item and "detail" in item:
-                                    formatted_text = (
-                                        f"<b>{item['prediction']}:</b> {item['detail']}"
-                                    )
-                                    # Add citation if available
-                                    if "source" in item and "source_url" in item:
-                                        clean_url = self._clean_url_for_link(
-                                            item["source_url"]
-                                        )
-                                        formatted_text += f" (<link href='{clean_url}' color='blue'>{item['source']}</link>)"
-                                elif "stakeholder" in item and "recommendation" in item:
-                                    formatted_text = f"<b>{item['stakeholder']}:</b> {item['recommendation']}"
-                                    # Add citation if available
-                                    if "source" in item and "source_url" in item:
-                                        clean_url = self._clean_url_for_link(
-                                            item["source_url"]
-                                        )
-                                        formatted_text += f" (<link href='{clean_url}' color='blue'>{item['source']}</link>)"
-                                else:
-                                    # Generic dictionary handling - look for source and source_url
-                                    base_content = " - ".join(
-                                        [
-                                            f"{k}: {v}"
-                                            for k, v in item.items()
-                                            if k not in ["source", "source_url"]
-                                        ]
-                                    )
-                                    if "source" in item and "source_url" in item:
-                                        clean_url = self._clean_url_for_link(
-                                            item["source_url"]
-                                        )
-                                        formatted_text = f"{base_content} (<link href='{clean_url}' color='blue'>{item['source']}</link>)"
-                                    else:
-                                        formatted_text = base_content
+                            if type(item) is dict:
+                                formatted_text = self._format_insight_item(item)
                             else:
                                 formatted_text = str(item)
 
@@ -2698,29 +2885,37 @@ class ReportGenerator:
                                 formatted_text
                             ).strip()
                             story.append(
-                                Paragraph(
+                                _text_flowable(
                                     f"{item_letter} {cleaned_text}", legal_level4_style
                                 )
                             )
+                        story.append(Spacer(1, _PDF_TINY_SPACE))
                     else:
-                        story.append(
-                            Paragraph(self._clean_text_for_pdf(str(value)), body_style)
+                        story.extend(
+                            (
+                                Paragraph(
+                                    self._clean_text_for_pdf(str(value)), body_style
+                                ),
+                                Spacer(1, _PDF_TINY_SPACE),
+                            )
                         )
-                    story.append(Spacer(1, 0.03 * inch))
+                story.append(Spacer(1, _PDF_SMALL_SPACE))
             else:
-                story.append(
-                    Paragraph(self._clean_text_for_pdf(str(insights)), body_style)
+                story.extend(
+                    (
+                        Paragraph(self._clean_text_for_pdf(str(insights)), body_style),
+                        Spacer(1, _PDF_SMALL_SPACE),
+                    )
                 )
-            story.append(Spacer(1, 0.05 * inch))
 
         if "comparable_cases" in insight_json:
             story.append(Paragraph("<b>C. Comparable Cases</b>", subheading_style))
             cases = insight_json["comparable_cases"]
             for i, case in enumerate(cases, 1):
-                if isinstance(case, dict):
+                if type(case) is dict:
                     case_name = case.get("case_name", "Unknown Case")
                     source_url = case.get("source_url", "")
-                    case_num = get_legal_section_number(3, i)
+                    case_num = _legal_section_number(3, i)
 
                     # Format case name with hyperlink if URL available
                     if source_url:
@@ -2730,7 +2925,7 @@ class ReportGenerator:
                         case_title = (
                             f"<b>{case_num} {self._clean_text_for_pdf(case_name)}</b>"
                         )
-                    story.append(Paragraph(case_title, legal_level3_style))
+                    case_flowables = [Paragraph(case_title, legal_level3_style)]
 
                     sub_item_counter = 0
                     for field in [
@@ -2742,18 +2937,19 @@ class ReportGenerator:
                         if field in case:
                             sub_item_counter += 1
                             value = case[field]
-                            field_title = field.replace("_", " ").title()
-                            sub_item_letter = get_legal_section_number(
+                            field_title = _display_key(field)
+                            sub_item_letter = _legal_section_number(
                                 4, sub_item_counter
                             )
-                            story.append(
+                            case_flowables.append(
                                 Paragraph(
                                     f"{sub_item_letter} <b>{field_title}:</b> {self._clean_text_for_pdf(str(value))}",
                                     legal_level4_style,
                                 )
                             )
 
-                    story.append(Spacer(1, 0.05 * inch))
+                    case_flowables.append(Spacer(1, _PDF_SMALL_SPACE))
+                    story.extend(case_flowables)
 
         # Other sections with legal numbering
         if "regulatory_intelligence" in insight_json:
@@ -2766,97 +2962,27 @@ class ReportGenerator:
                 # Parse structured regulatory intelligence
                 subsection_counter = 0
 
-                if "agency_guidance" in reg_intel:
-                    subsection_counter += 1
-                    sub_num = get_legal_section_number(3, subsection_counter)
-                    story.append(
-                        Paragraph(f"<b>{sub_num} Agency Guidance</b>", body_style)
-                    )
-
-                    guidance_list = reg_intel["agency_guidance"]
-                    if isinstance(guidance_list, list):
-                        for i, guidance in enumerate(guidance_list, 1):
-                            if isinstance(guidance, dict):
-                                source = guidance.get("source", "Unknown")
-                                details = guidance.get(
-                                    "detail", guidance.get("details", "")
-                                )  # Try both 'detail' and 'details'
-                                source_url = guidance.get("source_url", "")
-                                item_letter = get_legal_section_number(4, i)
-
-                                # Format with hyperlink if URL available
-                                if source_url:
-                                    formatted_text = f"{item_letter} <b><link href='{self._clean_url_for_link(source_url)}' color='blue'>{self._clean_text_for_pdf(source)}</link>:</b> {self._clean_text_for_pdf(details)}"
-                                else:
-                                    formatted_text = f"{item_letter} <b>{self._clean_text_for_pdf(source)}:</b> {self._clean_text_for_pdf(details)}"
-                                story.append(
-                                    Paragraph(formatted_text, legal_level4_style)
-                                )
-                    story.append(Spacer(1, 0.03 * inch))
-
-                if "congressional_activity" in reg_intel:
-                    subsection_counter += 1
-                    sub_num = get_legal_section_number(3, subsection_counter)
-                    story.append(
-                        Paragraph(
-                            f"<b>{sub_num} Congressional Activity</b>", body_style
+                for key, title in _REGULATORY_INTELLIGENCE_SECTIONS:
+                    if key in reg_intel:
+                        subsection_counter += 1
+                        sub_num = _legal_section_number(3, subsection_counter)
+                        story.append(
+                            Paragraph(f"<b>{sub_num} {title}</b>", body_style)
                         )
-                    )
-
-                    activity_list = reg_intel["congressional_activity"]
-                    if isinstance(activity_list, list):
-                        for i, activity in enumerate(activity_list, 1):
-                            if isinstance(activity, dict):
-                                source = activity.get("source", "Unknown")
-                                details = activity.get(
-                                    "detail", activity.get("details", "")
-                                )  # Try both 'detail' and 'details'
-                                source_url = activity.get("source_url", "")
-                                item_letter = get_legal_section_number(4, i)
-
-                                # Format with hyperlink if URL available
-                                if source_url:
-                                    formatted_text = f"{item_letter} <b><link href='{self._clean_url_for_link(source_url)}' color='blue'>{self._clean_text_for_pdf(source)}</link>:</b> {self._clean_text_for_pdf(details)}"
-                                else:
-                                    formatted_text = f"{item_letter} <b>{self._clean_text_for_pdf(source)}:</b> {self._clean_text_for_pdf(details)}"
-                                story.append(
-                                    Paragraph(formatted_text, legal_level4_style)
-                                )
-                    story.append(Spacer(1, 0.03 * inch))
-
-                if "industry_responses" in reg_intel:
-                    subsection_counter += 1
-                    sub_num = get_legal_section_number(3, subsection_counter)
-                    story.append(
-                        Paragraph(f"<b>{sub_num} Industry Responses</b>", body_style)
-                    )
-
-                    response_list = reg_intel["industry_responses"]
-                    if isinstance(response_list, list):
-                        for i, response in enumerate(response_list, 1):
-                            if isinstance(response, dict):
-                                source = response.get("source", "Unknown")
-                                details = response.get(
-                                    "detail", response.get("details", "")
-                                )  # Try both 'detail' and 'details'
-                                source_url = response.get("source_url", "")
-                                item_letter = get_legal_section_number(4, i)
-
-                                # Format with hyperlink if URL available
-                                if source_url:
-                                    formatted_text = f"{item_letter} <b><link href='{self._clean_url_for_link(source_url)}' color='blue'>{self._clean_text_for_pdf(source)}</link>:</b> {self._clean_text_for_pdf(details)}"
-                                else:
-                                    formatted_text = f"{item_letter} <b>{self._clean_text_for_pdf(source)}:</b> {self._clean_text_for_pdf(details)}"
-                                story.append(
-                                    Paragraph(formatted_text, legal_level4_style)
-                                )
-                    story.append(Spacer(1, 0.03 * inch))
+                        story.extend(
+                            self._source_detail_item_flowables(
+                                reg_intel[key], legal_level4_style
+                            )
+                        )
+                        story.append(Spacer(1, _PDF_TINY_SPACE))
             else:
                 # Fallback for string/other formats
-                story.append(
-                    Paragraph(self._clean_text_for_pdf(str(reg_intel)), body_style)
+                story.extend(
+                    (
+                        Paragraph(self._clean_text_for_pdf(str(reg_intel)), body_style),
+                        Spacer(1, _PDF_TINY_SPACE),
+                    )
                 )
-                story.append(Spacer(1, 0.03 * inch))
 
         if "market_impact" in insight_json:
             story.append(Paragraph("<b>E. Market Impact</b>", subheading_style))
@@ -2866,54 +2992,31 @@ class ReportGenerator:
                 # Parse structured market impact
                 subsection_counter = 0
 
-                for category in [
-                    "stock_responses",
-                    "insurance_risk",
-                    "compliance_market",
-                ]:
+                for category in _MARKET_IMPACT_CATEGORIES:
                     if category in market:
                         subsection_counter += 1
-                        sub_num = get_legal_section_number(3, subsection_counter)
+                        sub_num = _legal_section_number(3, subsection_counter)
 
-                        category_title = category.replace("_", " ").title()
+                        category_title = _display_key(category)
                         story.append(
                             Paragraph(f"<b>{sub_num} {category_title}</b>", body_style)
                         )
-
-                        category_list = market[category]
-                        if isinstance(category_list, list):
-                            for i, item in enumerate(category_list, 1):
-                                if isinstance(item, dict):
-                                    source = item.get("source", "Unknown")
-                                    details = item.get(
-                                        "detail", item.get("details", "")
-                                    )  # Try both 'detail' and 'details'
-                                    source_url = item.get("source_url", "")
-                                    item_letter = get_legal_section_number(4, i)
-
-                                    # Format with hyperlink if URL available
-                                    if source_url:
-                                        formatted_text = f"{item_letter} <b><link href='{self._clean_url_for_link(source_url)}' color='blue'>{self._clean_text_for_pdf(source)}</link>:</b> {self._clean_text_for_pdf(details)}"
-                                    else:
-                                        formatted_text = f"{item_letter} <b>{self._clean_text_for_pdf(source)}:</b> {self._clean_text_for_pdf(details)}"
-                                    story.append(
-                                        Paragraph(formatted_text, legal_level4_style)
-                                    )
-                                else:
-                                    item_letter = get_legal_section_number(4, i)
-                                    story.append(
-                                        Paragraph(
-                                            f"{item_letter} {self._clean_text_for_pdf(str(item))}",
-                                            legal_level4_style,
-                                        )
-                                    )
-                        story.append(Spacer(1, 0.03 * inch))
+                        story.extend(
+                            self._source_detail_item_flowables(
+                                market[category],
+                                legal_level4_style,
+                                include_plain_items=True,
+                            )
+                        )
+                        story.append(Spacer(1, _PDF_TINY_SPACE))
             else:
                 # Fallback for string/other formats
-                story.append(
-                    Paragraph(self._clean_text_for_pdf(str(market)), body_style)
+                story.extend(
+                    (
+                        Paragraph(self._clean_text_for_pdf(str(market)), body_style),
+                        Spacer(1, _PDF_SMALL_SPACE),
+                    )
                 )
-                story.append(Spacer(1, 0.05 * inch))
 
     def _render_markdown_analysis_to_pdf(
         self,
@@ -2927,21 +3030,25 @@ class ReportGenerator:
         article_index: int,
     ):
         """Render markdown analysis to PDF (fallback method)."""
-        from reportlab.platypus import Paragraph, Spacer
-        from reportlab.lib.units import inch
-
         # Parse and add the detailed analysis
         analysis_lines = detailed_analysis.split("\n")
 
         # Check for tables and process them specially
         table_lines = []  # Simplified: skip table extraction for now
 
+        render_styles = (heading_style, subheading_style, body_style, bullet_style)
         # Section counter for bookmarks
-        section_counter = 0
+        render_state = {"article_id": article_id, "section_counter": 0}
+
+        # Classify every line once up front, binding each handler method once
+        stripped_lines = [line.strip() for line in analysis_lines]
+        handler_names = [_markdown_line_handler(line) for line in stripped_lines]
+        handlers = {name: getattr(self, name) for name in set(handler_names) if name}
+        line_handlers = [handlers.get(name) for name in handler_names]
 
         line_idx = 0
         while line_idx < len(analysis_lines):
-            line = analysis_lines[line_idx].strip()
+            line = stripped_lines[line_idx]
 
             # Check if this line starts a table
             if line_idx in table_lines:
@@ -2971,7 +3078,7 @@ class ReportGenerator:
                         self._add_case_analysis_paragraphs(
                             table_data, story, body_style
                         )
-                        story.append(Spacer(1, 0.05 * inch))  # Reduced spacing
+                        story.append(Spacer(1, _PDF_SMALL_SPACE))  # Reduced spacing
                     line_idx += lines_consumed
                     continue
 
@@ -2980,127 +3087,93 @@ class ReportGenerator:
                 )
                 if table_data:
                     story.append(self._create_pdf_table(table_data))
-                    story.append(Spacer(1, 0.05 * inch))  # Reduced spacing
+                    story.append(Spacer(1, _PDF_SMALL_SPACE))  # Reduced spacing
                     line_idx += lines_consumed
                     continue
 
             # Process regular lines
-            if not line:
-                line_idx += 1
-                continue
+            render_line = line_handlers[line_idx]
+            if render_line is not None:
+                render_line(line, story, render_styles, render_state)
 
-            # Skip redundant source article line (already shown in Article Information)
-            if "SOURCE ARTICLE:" in line:
-                line_idx += 1
-                continue
+            line_idx += 1
 
-            if line.startswith("####"):
-                # Sub-sub-heading
-                header_text = line[4:].strip()
-                story.append(
-                    Paragraph(
-                        f"<b>{self._clean_text_for_pdf(header_text)}</b>", body_style
-                    )
-                )
-            elif line.startswith("###"):
-                # Sub-heading
-                header_text = line[3:].strip()
-                story.append(
-                    Paragraph(self._clean_text_for_pdf(header_text), subheading_style)
-                )
-            elif line.startswith("##"):
-                # Major heading with bookmark
-                header_text = line[2:].strip()
-                # Check if this is a main section that should get a bookmark and add legal numbering
-                if any(
-                    section in header_text.upper()
-                    for section in [
-                        "EXECUTIVE SUMMARY",
-                        "CASE ANALYSIS",
-                        "MARKET INTELLIGENCE",
-                        "BLOG POST OUTLINE",
-                    ]
-                ):
-                    section_counter += 1
-                    section_id = f"{article_id}_section_{section_counter}"
-                    # Add legal document numbering for main sections
-                    section_num = f"{section_counter}."
-                    story.append(
-                        Paragraph(
-                            f'<a name="{section_id}"/>{section_num} {self._clean_text_for_pdf(header_text)}',
-                            heading_style,
-                        )
-                    )
-                else:
-                    story.append(
-                        Paragraph(self._clean_text_for_pdf(header_text), heading_style)
-                    )
-            elif line.startswith("  - ") or line.startswith("  * "):
-                # Indented sub-bullet (2 spaces)
-                bullet_text = line[4:].strip()
-                story.append(
-                    Paragraph(
-                        f"    ◦ {self._clean_text_for_pdf(bullet_text)}", bullet_style
-                    )
-                )
-            elif line.startswith("   - ") or line.startswith("   * "):
-                # Indented sub-bullet (3+ spaces)
-                bullet_text = line[5:].strip()
-                story.append(
-                    Paragraph(
-                        f"    ◦ {self._clean_text_for_pdf(bullet_text)}", bullet_style
-                    )
-                )
-            elif line.startswith("- ") or line.startswith("* "):
-                # Regular bullet point
-                bullet_text = line[2:].strip()
+    def _render_markdown_subsubheading(self, line, story, styles, state):
+        """Render a ``####`` line as a bold body paragraph."""
+        header_text = line[4:].strip()
+        story.append(
+            Paragraph(f"<b>{self._clean_text_for_pdf(header_text)}</b>", styles[2])
+        )
 
-                # Check if this looks like a case start (Similarity pattern)
-                if bullet_text.startswith("**Similarity:**"):
-                    # This might be the start of a new case - add some spacing
-                    story.append(Spacer(1, 0.05 * inch))
-                    story.append(
-                        Paragraph(
-                            f"• {self._clean_text_for_pdf(bullet_text)}", bullet_style
-                        )
-                    )
-                else:
-                    story.append(
-                        Paragraph(
-                            f"• {self._clean_text_for_pdf(bullet_text)}", bullet_style
-                        )
-                    )
-            elif re.match(r"^\d+\.\s+\*\*.*\*\*", line):
-                # Numbered list item with bold text (e.g., "1. **Case Name:**")
-                story.append(Paragraph(self._clean_text_for_pdf(line), bullet_style))
-            elif line.startswith("**") and line.endswith("**"):
-                # Bold standalone line
-                bold_text = line[2:-2]
-                story.append(
-                    Paragraph(
-                        f"<b>{self._clean_text_for_pdf(bold_text)}</b>", body_style
-                    )
+    def _render_markdown_subheading(self, line, story, styles, state):
+        """Render a ``###`` line as a sub-heading."""
+        header_text = line[3:].strip()
+        story.append(Paragraph(self._clean_text_for_pdf(header_text), styles[1]))
+
+    def _render_markdown_heading(self, line, story, styles, state):
+        """Render a ``##`` line, numbering and bookmarking main sections."""
+        header_text = line[2:].strip()
+        # Check if this is a main section that should get a bookmark and add legal numbering
+        if _MAIN_SECTION_RE.search(header_text.upper()):
+            state["section_counter"] += 1
+            section_id = f"{state['article_id']}_section_{state['section_counter']}"
+            # Add legal document numbering for main sections
+            section_num = f"{state['section_counter']}."
+            story.append(
+                Paragraph(
+                    f'<a name="{section_id}"/>{section_num} {self._clean_text_for_pdf(header_text)}',
+                    styles[0],
                 )
-            elif line.startswith("---"):
-                # Horizontal rule
-                story.append(Spacer(1, 0.1 * inch))
-            elif (
-                line and not line.startswith("#") and not self._is_formatting_note(line)
-            ):
-                # Check if this is concatenated bullet points
-                if "•" in line and line.count("•") > 1:
-                    # Split concatenated bullet points and process individually
-                    self._process_concatenated_bullets(line, story, bullet_style)
-                else:
-                    # Regular paragraph (skip formatting notes)
-                    story.append(Paragraph(self._clean_text_for_pdf(line), body_style))
+            )
+        else:
+            story.append(Paragraph(self._clean_text_for_pdf(header_text), styles[0]))
 
-            line_idx += 1
+    def _render_markdown_bullet(self, line, story, styles, state):
+        """Render a ``-``/``*`` bullet point."""
+        bullet_text = line[2:].strip()
+
+        # Check if this looks like a case start (Similarity pattern)
+        if bullet_text.startswith("**Similarity:**"):
+            # This might be the start of a new case - add some spacing
+            story.append(Spacer(1, _PDF_SMALL_SPACE))
+        story.append(
+            Paragraph(f"• {self._clean_text_for_pdf(bullet_text)}", styles[3])
+        )
+
+    def _render_markdown_bold_line(self, line, story, styles, state):
+        """Render a standalone ``**bold**`` line."""
+        if not line.endswith("**"):
+            self._render_markdown_text_line(line, story, styles, state)
+            return
+        bold_text = line[2:-2]
+        story.append(
+            Paragraph(f"<b>{self._clean_text_for_pdf(bold_text)}</b>", styles[2])
+        )
+
+    def _render_markdown_rule(self, line, story, styles, state):
+        """Render a horizontal rule as vertical space."""
+        story.append(Spacer(1, _PDF_MEDIUM_SPACE))
+
+    def _render_markdown_text_line(self, line, story, styles, state):
+        """Render a line that has no markdown block prefix."""
+        if _NUMBERED_BOLD_RE.match(line):
+            # Numbered list item with bold text (e.g., "1. **Case Name:**")
+            story.append(Paragraph(self._clean_text_for_pdf(line), styles[3]))
+        elif not line.startswith("#") and not self._is_formatting_note(line):
+            # Check if this is concatenated bullet points
+            if "•" in line and line.count("•") > 1:
+                # Split concatenated bullet points and process individually
+                self._process_concatenated_bullets(line, story, styles[3])
+            else:
+                # Regular paragraph (skip formatting notes)
+                story.append(Paragraph(self._clean_text_for_pdf(line), styles[2]))
 
     def _process_concatenated_bullets(self, line: str, story: List, bullet_style):
         """Process concatenated bullet points and preserve indentation."""
         # Split by bullet points but preserve the bullet symbols
         parts = line.split("•")
+        append = story.append
+        clean = self._clean_text_for_pdf
 
         for i, part in enumerate(parts):
             if i == 0 and not part.strip():
@@ -3113,23 +3186,9 @@ class ReportGenerator:
 
             # Check if this should be indented (contains specific patterns)
             # Look for patterns that indicate this is a sub-item
-            if (
-                bullet_text.startswith("Majority-owned")
-                or bullet_text.startswith("DOJ Civil")
-                or bullet_text.startswith("U.S. Attorney")
-                or bullet_text.startswith("Small Business Administration")
-                or bullet_text.startswith("GNGH2 Inc.")
-            ):
+            if bullet_text.startswith(_CONCATENATED_SUB_BULLET_PREFIXES):
                 # This is a sub-bullet
-                story.append(
-                    Paragraph(
-                        f"    ◦ {self._clean_text_for_pdf(bullet_text)}", bullet_style
-                    )
-                )
+                append(Paragraph(f"    ◦ {clean(bullet_text)}", bullet_style))
             else:
                 # Regular bullet
-                story.append(
-                    Paragraph(
-                        f"• {self._clean_text_for_pdf(bullet_text)}", bullet_style
-                    )
-                )
+                append(Paragraph(f"• {clean(bullet_text)}", bullet_style))
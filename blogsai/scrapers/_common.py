@@ -1,8 +1,16 @@
 """Common utilities and helper functions for government scrapers."""
 
+import atexit
+import glob
+import itertools
+import json
+import os
+import platform
 import re
 import logging
+import threading
 import weakref
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Optional
 from urllib.parse import urljoin, urlencode
@@ -15,11 +23,28 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    SessionNotCreatedException,
+    WebDriverException,
+)
 from webdriver_manager.chrome import ChromeDriverManager
 
+# orjson is optional; when installed it reads and writes the saved cookie
+# snapshots. Its JSONDecodeError subclasses ValueError like json's does.
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# The OS never changes while the process runs, so look it up once
+_PLATFORM_SYSTEM = platform.system()
+
 
 def log_safe_content(
     logger_func, message: str, content: str = None, max_length: int = 200
@@ -34,81 +59,254 @@ def log_safe_content(
         logger_func(f"{message} (Preview: {content_preview})")
 
 
-def setup_chrome_options():
-    """Set up Chrome options with proper binary path for macOS."""
-    import platform
-    import os
-    
+_CHROMEDRIVER_INSTALL_LOCK = threading.Lock()
+
+# Where WebDriver Manager keeps downloaded drivers, for both its older
+# (<platform>/<version>/chromedriver) and newer (.../<archive dir>/chromedriver)
+# layouts
+_WDM_CHROMEDRIVER_PATTERNS = tuple(
+    os.path.expanduser(os.path.join("~/.wdm/drivers/chromedriver", *parts))
+    for parts in (
+        ("*", "*", "chromedriver"),
+        ("*", "*", "chromedriver.exe"),
+        ("*", "*", "*", "chromedriver"),
+        ("*", "*", "*", "chromedriver.exe"),
+    )
+)
+
+
+def wait_for_element(driver, css_selector: str, timeout: float = 10) -> bool:
+    """Wait until an element matching ``css_selector`` is on the page.
+
+    Returns False instead of raising when ``timeout`` seconds pass first, so
+    callers can go on to parse whatever did load.
+    """
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def _downloaded_chromedriver_path() -> Optional[str]:
+    """Return the most recently downloaded WebDriver Manager ChromeDriver, if any."""
+    candidates = [
+        path
+        for pattern in _WDM_CHROMEDRIVER_PATTERNS
+        for path in glob.glob(pattern)
+        if os.access(path, os.X_OK)
+    ]
+    return max(candidates, key=os.path.getmtime, default=None)
+
+
+@lru_cache(maxsize=2)
+def _cached_chromedriver_install_path(check_latest: bool) -> str:
+    if not check_latest:
+        # A driver already on disk avoids WebDriver Manager's version check
+        downloaded = _downloaded_chromedriver_path()
+        if downloaded:
+            logger.info(f"Using downloaded ChromeDriver at {downloaded}")
+            return downloaded
+    return ChromeDriverManager().install()
+
+
+def _chromedriver_install_path(check_latest: bool = False) -> str:
+    """Return the WebDriver Manager ChromeDriver path, resolved once per process.
+
+    A driver WebDriver Manager has already downloaded is used directly;
+    otherwise (or with ``check_latest``) ``ChromeDriverManager().install()``
+    checks the driver version, which may hit the network. Set
+    ``BLOGSAI_REFRESH_DRIVER=1`` to force a fresh check.
+    """
+    # Serialize lookups so concurrently started scrapers don't race the download
+    with _CHROMEDRIVER_INSTALL_LOCK:
+        if os.getenv("BLOGSAI_REFRESH_DRIVER", "").lower() in ("1", "true", "yes"):
+            _cached_chromedriver_install_path.cache_clear()
+            check_latest = True
+        return _cached_chromedriver_install_path(check_latest)
+
+
+def _start_managed_chrome(options):
+    """Start Chrome with the WebDriver Manager ChromeDriver.
+
+    If a previously downloaded driver no longer matches the installed Chrome,
+    WebDriver Manager is asked for a compatible one and Chrome is started again.
+    """
+    driver_path = _chromedriver_install_path()
+    try:
+        return webdriver.Chrome(service=Service(driver_path), options=options)
+    except SessionNotCreatedException:
+        latest_path = _chromedriver_install_path(check_latest=True)
+        if latest_path == driver_path:
+            raise
+        logger.info(f"ChromeDriver at {driver_path} is outdated, using {latest_path}")
+        return webdriver.Chrome(service=Service(latest_path), options=options)
+
+
+# Usual macOS install locations, checked in order
+_MACOS_CHROME_BINARY_PATHS = (
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    "/Applications/Chrome.app/Contents/MacOS/Chrome",
+    "/usr/bin/google-chrome",
+    "/usr/local/bin/chrome",
+)
+_MACOS_CHROMEDRIVER_PATHS = (
+    "/opt/homebrew/bin/chromedriver",  # Apple Silicon Homebrew
+    "/usr/local/bin/chromedriver",     # Intel Homebrew
+    "/usr/bin/chromedriver",           # System installation
+)
+
+
+@lru_cache(maxsize=None)
+def _first_existing_path(paths: tuple) -> Optional[str]:
+    """Return the first of ``paths`` that exists, checked once per process."""
+    for path in paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+# Chrome flags shared by every scraper. Kept at module level so each driver
+# start only replays them onto a fresh Options object; the object itself is
+# never shared because callers append their own --remote-debugging-port.
+_CHROME_ARGUMENTS = (
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--disable-extensions",
+    "--disable-images",
+    "--disable-notifications",
+    "--disable-blink-features=AutomationControlled",
+    "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36",
+)
+_CHROME_EXPERIMENTAL_OPTIONS = (
+    ("excludeSwitches", ["enable-automation"]),
+    ("useAutomationExtension", False),
+    # Current Chrome ignores --disable-images; content settings actually block
+    # the downloads. Stylesheets are left on because the DOJ scraper clicks
+    # search controls whose layout depends on them.
+    (
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        },
+    ),
+)
+
+# URL patterns blocked over CDP in every driver the pool starts. Unlike the
+# prefs above this also covers the macOS fallback strategies, and it keeps
+# analytics and media that no scraper reads from being downloaded at all.
+_BLOCKED_URL_PATTERNS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.webp",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.mp4",
+    "*.webm",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*dap.digitalgov.gov*",
+)
+# Also blocked for scrapers that never interact with the page's layout
+_STYLESHEET_URL_PATTERNS = ("*.css",)
+
+# Minimal flag sets used by the macOS fallback strategies
+_BASIC_CHROME_ARGUMENTS = (
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+)
+_SYSTEM_CHROMEDRIVER_ARGUMENTS = _BASIC_CHROME_ARGUMENTS[:3]
+
+
+def _build_chrome_options(arguments: tuple, experimental_options: tuple = ()):
+    """Return a new Options object populated with ``arguments``."""
     chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-images")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    # Note: remote-debugging-port is set dynamically in initialize_chrome_driver()
-    chrome_options.add_argument(
-        "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36"
+    for argument in arguments:
+        chrome_options.add_argument(argument)
+    for name, value in experimental_options:
+        # Copy mutable values so no two Options objects share them
+        if isinstance(value, (list, dict)):
+            value = value.copy()
+        chrome_options.add_experimental_option(name, value)
+    return chrome_options
+
+
+def setup_chrome_options(debug_port: Optional[int] = None):
+    """Set up Chrome options with proper binary path for macOS."""
+    chrome_options = _build_chrome_options(
+        _CHROME_ARGUMENTS, _CHROME_EXPERIMENTAL_OPTIONS
     )
-    
+    # Return from driver.get() at DOMContentLoaded instead of waiting for
+    # analytics and other late subresources; scrapers wait explicitly
+    chrome_options.page_load_strategy = "eager"
+    if debug_port is not None:
+        chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
+
     # Add macOS-specific Chrome binary path if needed
-    if platform.system() == "Darwin":  # macOS
-        possible_chrome_paths = [
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-            "/Applications/Chrome.app/Contents/MacOS/Chrome",
-            "/usr/bin/google-chrome",
-            "/usr/local/bin/chrome"
-        ]
-        
-        for chrome_path in possible_chrome_paths:
-            if os.path.exists(chrome_path):
-                chrome_options.binary_location = chrome_path
-                logger.info(f"Set Chrome binary location: {chrome_path}")
-                break
+    if _PLATFORM_SYSTEM == "Darwin":  # macOS
+        chrome_path = _first_existing_path(_MACOS_CHROME_BINARY_PATHS)
+        if chrome_path:
+            chrome_options.binary_location = chrome_path
+            logger.info(f"Set Chrome binary location: {chrome_path}")
         else:
             logger.warning("Chrome binary not found at expected locations")
-    
+
     return chrome_options
 
 
+def _basic_chrome_options(arguments: tuple, debug_port: Optional[int] = None):
+    """Return minimal options for the macOS fallback strategies."""
+    chrome_options = _build_chrome_options(arguments)
+    if debug_port is not None:
+        chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
+    return chrome_options
+
+
+# Each driver start gets its own remote debugging port, so any number of
+# scrapers (and fallback strategies) can run side by side without clashing
+_DEBUG_PORTS = itertools.count(9222)
+_DEBUG_PORTS_LOCK = threading.Lock()
+
+
+def _next_debug_port() -> int:
+    with _DEBUG_PORTS_LOCK:
+        return next(_DEBUG_PORTS)
+
+
 def initialize_chrome_driver(scraper_name: str):
     """Initialize ChromeDriver with platform-specific strategies."""
     from selenium import webdriver
     from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.chrome.options import Options
     from webdriver_manager.chrome import ChromeDriverManager
     import subprocess
-    import platform
-    import os
-    import random
     
     logger.info(f"Initializing ChromeDriver for {scraper_name}...")
     
     # Windows: Use the existing working approach with unique ports
-    if platform.system() == "Windows":
+    if _PLATFORM_SYSTEM == "Windows":
         try:
             logger.info(f"Windows: Standard ChromeDriver setup for {scraper_name}")
-            chrome_options = setup_chrome_options()
-            
-            # Use different debugging ports for each scraper to avoid conflicts
-            port_map = {
-                "Department of Justice": 9222,
-                "Securities and Exchange Commission": 9223, 
-                "Commodity Futures Trading Commission": 9224
-            }
-            debug_port = port_map.get(scraper_name, 9222 + random.randint(10, 99))
-            
-            # Update the remote debugging port to avoid conflicts
-            chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
+            # Use a unique debugging port for each driver to avoid conflicts
+            debug_port = _next_debug_port()
+            chrome_options = setup_chrome_options(debug_port)
             logger.info(f"Using debug port {debug_port} for {scraper_name}")
             
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = _start_managed_chrome(chrome_options)
             logger.info(f"Windows ChromeDriver initialized successfully for {scraper_name}")
             return driver
         except Exception as e:
@@ -116,7 +314,7 @@ def initialize_chrome_driver(scraper_name: str):
             return None
     
     # macOS: Use multiple fallback strategies for compatibility
-    elif platform.system() == "Darwin":
+    elif _PLATFORM_SYSTEM == "Darwin":
         # Strategy 1: Try older stable ChromeDriver version first
         try:
             logger.info(f"macOS Strategy 1: Using stable ChromeDriver 130.x for {scraper_name}")
@@ -125,11 +323,7 @@ def initialize_chrome_driver(scraper_name: str):
             stable_chromedriver_path = os.path.expanduser("~/.wdm/drivers/chromedriver/mac64/130.0.6723.116/chromedriver-mac-arm64/chromedriver")
             
             if os.path.exists(stable_chromedriver_path):
-                basic_options = Options()
-                basic_options.add_argument("--headless")
-                basic_options.add_argument("--no-sandbox")
-                basic_options.add_argument("--disable-dev-shm-usage")
-                basic_options.add_argument("--disable-gpu")
+                basic_options = _basic_chrome_options(_BASIC_CHROME_ARGUMENTS)
                 
                 service = Service(stable_chromedriver_path)
                 driver = webdriver.Chrome(service=service, options=basic_options)
@@ -145,26 +339,13 @@ def initialize_chrome_driver(scraper_name: str):
         try:
             logger.info(f"macOS Strategy 1b: WebDriver Manager ChromeDriver for {scraper_name}")
             
-            basic_options = Options()
-            basic_options.add_argument("--headless")
-            basic_options.add_argument("--no-sandbox")
-            basic_options.add_argument("--disable-dev-shm-usage")
-            basic_options.add_argument("--disable-gpu")
-            
-            # Add unique debugging port for each scraper to avoid conflicts
-            port_map = {
-                "Department of Justice": 9222,
-                "Securities and Exchange Commission": 9223, 
-                "Commodity Futures Trading Commission": 9224
-            }
-            debug_port = port_map.get(scraper_name, 9222 + random.randint(10, 99))
-            basic_options.add_argument(f"--remote-debugging-port={debug_port}")
+            # Add unique debugging port for each driver to avoid conflicts
+            debug_port = _next_debug_port()
+            basic_options = _basic_chrome_options(_BASIC_CHROME_ARGUMENTS, debug_port)
             logger.info(f"Using debug port {debug_port} for {scraper_name}")
             
             os.environ['WDM_LOG_LEVEL'] = '0'
-            service = Service(ChromeDriverManager().install())
-            
-            driver = webdriver.Chrome(service=service, options=basic_options)
+            driver = _start_managed_chrome(basic_options)
             logger.info(f"macOS Strategy 1b: WebDriver Manager ChromeDriver initialized successfully for {scraper_name}")
             return driver
             
@@ -175,26 +356,14 @@ def initialize_chrome_driver(scraper_name: str):
         try:
             logger.info(f"macOS Strategy 2: Auto-compatible ChromeDriver for {scraper_name}")
             
-            basic_options = Options()
-            basic_options.add_argument("--headless")
-            basic_options.add_argument("--no-sandbox")
-            basic_options.add_argument("--disable-dev-shm-usage")
-            basic_options.add_argument("--disable-gpu")
-            
-            # Add unique debugging port for each scraper to avoid conflicts
-            port_map = {
-                "Department of Justice": 9225,  # Different ports from Strategy 1b
-                "Securities and Exchange Commission": 9226, 
-                "Commodity Futures Trading Commission": 9227
-            }
-            debug_port = port_map.get(scraper_name, 9225 + random.randint(10, 99))
-            basic_options.add_argument(f"--remote-debugging-port={debug_port}")
+            # Add unique debugging port for each driver to avoid conflicts
+            debug_port = _next_debug_port()
+            basic_options = _basic_chrome_options(_BASIC_CHROME_ARGUMENTS, debug_port)
             logger.info(f"Using debug port {debug_port} for {scraper_name} (Strategy 2)")
             
             # Use WebDriver Manager to automatically download compatible ChromeDriver
             os.environ['WDM_LOG_LEVEL'] = '0'  # Suppress verbose logs
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=basic_options)
+            driver = _start_managed_chrome(basic_options)
             logger.info(f"macOS Strategy 2: Auto-compatible ChromeDriver initialized successfully for {scraper_name}")
             return driver
                 
@@ -205,33 +374,15 @@ def initialize_chrome_driver(scraper_name: str):
         try:
             logger.info(f"macOS Strategy 3: System ChromeDriver for {scraper_name}")
             
-            chromedriver_paths = [
-                "/opt/homebrew/bin/chromedriver",  # Apple Silicon Homebrew
-                "/usr/local/bin/chromedriver",     # Intel Homebrew
-                "/usr/bin/chromedriver"            # System installation
-            ]
-            
-            system_chromedriver = None
-            for path in chromedriver_paths:
-                if os.path.exists(path):
-                    system_chromedriver = path
-                    break
+            system_chromedriver = _first_existing_path(_MACOS_CHROMEDRIVER_PATHS)
             
             if system_chromedriver:
                 logger.info(f"Found system ChromeDriver at {system_chromedriver}")
-                basic_options = Options()
-                basic_options.add_argument("--headless")
-                basic_options.add_argument("--no-sandbox")
-                basic_options.add_argument("--disable-dev-shm-usage")
-                
-                # Add unique debugging port for each scraper to avoid conflicts
-                port_map = {
-                    "Department of Justice": 9228,  # Different ports from other strategies
-                    "Securities and Exchange Commission": 9229, 
-                    "Commodity Futures Trading Commission": 9230
-                }
-                debug_port = port_map.get(scraper_name, 9228 + random.randint(10, 99))
-                basic_options.add_argument(f"--remote-debugging-port={debug_port}")
+                # Add unique debugging port for each driver to avoid conflicts
+                debug_port = _next_debug_port()
+                basic_options = _basic_chrome_options(
+                    _SYSTEM_CHROMEDRIVER_ARGUMENTS, debug_port
+                )
                 logger.info(f"Using debug port {debug_port} for {scraper_name} (Strategy 3)")
                 
                 service = Service(system_chromedriver)
@@ -252,10 +403,207 @@ def initialize_chrome_driver(scraper_name: str):
         try:
             logger.info(f"Linux: Standard ChromeDriver setup for {scraper_name}")
             chrome_options = setup_chrome_options()
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver = _start_managed_chrome(chrome_options)
             logger.info(f"Linux ChromeDriver initialized successfully for {scraper_name}")
             return driver
         except Exception as e:
             logger.error(f"Linux ChromeDriver failed for {scraper_name}: {e}")
             return None
+
+
+# Saved cookies older than this are ignored when a fresh driver starts
+_COOKIE_TTL_SECONDS = 24 * 60 * 60
+
+# Keys of a WebDriver cookie that CDP's Network.setCookies accepts unchanged
+_CDP_COOKIE_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+
+
+def _cdp_cookie(cookie: dict) -> dict:
+    """Convert a cookie from ``driver.get_cookies()`` to a CDP CookieParam."""
+    cdp_cookie = {key: cookie[key] for key in _CDP_COOKIE_KEYS if key in cookie}
+    if "expiry" in cookie:
+        cdp_cookie["expires"] = cookie["expiry"]
+    return cdp_cookie
+
+
+class ChromeDriverPool:
+    """Process-wide pool of idle ChromeDriver sessions.
+
+    Scrapers acquire a driver when they are created and release it when they
+    are closed, so later scrape runs in the same process reuse a warm Chrome
+    session instead of cold-starting a new one. Idle drivers are grouped by
+    the scraper that last released them and preferably go back to it, but
+    every driver has its own debugging port, so any scraper can borrow
+    another's idle browser rather than start one.
+
+    At most ``max_idle_per_scraper`` drivers are kept idle for each scraper;
+    extra drivers released after a burst of concurrent rendering are quit
+    rather than left holding a Chrome process for the rest of the session.
+
+    When ``cookie_dir`` is set, each scraper's cookies are saved there on
+    release and injected into the next freshly started driver, so session and
+    anti-bot cookies also survive across application runs.
+    """
+
+    def __init__(
+        self, cookie_dir: Optional[Path] = None, max_idle_per_scraper: int = 1
+    ):
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._cookie_dir = cookie_dir
+        self._max_idle_per_scraper = max_idle_per_scraper
+
+    def acquire(self, scraper_name: str, block_stylesheets: bool = False):
+        """Return an idle driver for ``scraper_name``, or start a new one.
+
+        A driver last used by ``scraper_name`` is preferred; otherwise another
+        scraper's idle driver is borrowed and this scraper's saved cookies
+        are restored into it. Stylesheets are blocked only when asked for,
+        since drivers move between scrapers with different needs.
+        """
+        while True:
+            with self._lock:
+                driver, last_user = self._pop_idle(scraper_name)
+            if driver is None:
+                driver = initialize_chrome_driver(scraper_name)
+                if driver is not None:
+                    self._block_urls(driver, block_stylesheets)
+                    self._restore_cookies(scraper_name, driver)
+                return driver
+            try:
+                # Make sure the browser session survived while idle
+                driver.current_url
+                logger.info(
+                    f"Reusing pooled ChromeDriver of {last_user} for {scraper_name}"
+                )
+                if last_user != scraper_name:
+                    self._restore_cookies(scraper_name, driver)
+                self._block_urls(driver, block_stylesheets)
+                return driver
+            except WebDriverException as e:
+                logger.warning(
+                    f"Discarding dead pooled ChromeDriver for {scraper_name}: {e}"
+                )
+                self._quit(driver)
+
+    def release(self, scraper_name: str, driver):
+        """Return ``driver`` to the pool, saving its cookies for later runs."""
+        if driver is None:
+            return
+        try:
+            cookies = driver.get_cookies()
+        except WebDriverException as e:
+            logger.warning(f"Not pooling ChromeDriver for {scraper_name}: {e}")
+            self._quit(driver)
+            return
+        self._save_cookies(scraper_name, cookies)
+        with self._lock:
+            idle = self._idle.setdefault(scraper_name, [])
+            pooled = len(idle) < self._max_idle_per_scraper
+            if pooled:
+                idle.append(driver)
+        if not pooled:
+            logger.info(f"Idle pool full for {scraper_name}, quitting ChromeDriver")
+            self._quit(driver)
+
+    def close_all(self):
+        """Quit every idle driver."""
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    def _pop_idle(self, scraper_name: str):
+        """Pop an idle driver and the scraper that last used it (lock held)."""
+        for last_user in itertools.chain([scraper_name], self._idle):
+            idle = self._idle.get(last_user)
+            if idle:
+                return idle.pop(), last_user
+        return None, None
+
+    def _cookie_path(self, scraper_name: str) -> Optional[Path]:
+        if self._cookie_dir is None:
+            return None
+        slug = re.sub(r"[^a-z0-9]+", "-", scraper_name.lower()).strip("-")
+        return Path(self._cookie_dir) / f"{slug}.json"
+
+    def _save_cookies(self, scraper_name: str, cookies: list):
+        cookie_path = self._cookie_path(scraper_name)
+        if cookie_path is None:
+            return
+        try:
+            cookie_path.parent.mkdir(parents=True, exist_ok=True)
+            if HAS_ORJSON:
+                data = orjson.dumps(cookies)
+            else:
+                data = json.dumps(cookies).encode("utf-8")
+            # Write a private temp file and swap it in, so the cookies are
+            # never readable by other users, even briefly
+            tmp_path = cookie_path.with_suffix(".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cookie_path)
+        except OSError as e:
+            logger.warning(f"Could not save cookies for {scraper_name}: {e}")
+
+    def _restore_cookies(self, scraper_name: str, driver):
+        cookie_path = self._cookie_path(scraper_name)
+        if cookie_path is None:
+            return
+        try:
+            if time.time() - cookie_path.stat().st_mtime > _COOKIE_TTL_SECONDS:
+                return
+            if HAS_ORJSON:
+                cookies = orjson.loads(cookie_path.read_bytes())
+            else:
+                cookies = json.loads(cookie_path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read saved cookies for {scraper_name}: {e}")
+            return
+        if not cookies:
+            return
+        try:
+            # CDP sets cookies for any domain without first navigating there
+            driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [_cdp_cookie(cookie) for cookie in cookies]},
+            )
+            logger.info(f"Restored {len(cookies)} saved cookies for {scraper_name}")
+        except WebDriverException as e:
+            logger.warning(f"Could not restore cookies for {scraper_name}: {e}")
+
+    @staticmethod
+    def _block_urls(driver, block_stylesheets: bool = False):
+        """Stop ``driver`` from downloading ``_BLOCKED_URL_PATTERNS``.
+
+        This replaces whatever block list the driver had before.
+        """
+        patterns = list(_BLOCKED_URL_PATTERNS)
+        if block_stylesheets:
+            patterns.extend(_STYLESHEET_URL_PATTERNS)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except WebDriverException as e:
+            logger.warning(f"Could not block resource URLs: {e}")
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting ChromeDriver: {e}")
+
+
+def _default_cookie_dir() -> Path:
+    from ..config.app_dirs import app_dirs
+
+    return app_dirs.app_cache_dir / "cookies"
+
+
+chrome_driver_pool = ChromeDriverPool(cookie_dir=_default_cookie_dir())
+atexit.register(chrome_driver_pool.close_all)
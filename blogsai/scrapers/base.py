@@ -1,95 +1,591 @@
 """Base scraper classes and utilities."""
 
 import time
+import queue
+import random
 import requests
-import hashlib
+import soupsieve
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import WebDriverException
 from urllib.parse import urljoin, urlparse
 
 from ..config.config import SourceConfig, ScrapingConfig
+from ..database.models import generate_title_hash
+from ._common import chrome_driver_pool, wait_for_element
 
+# lxml is an optional C parser that BeautifulSoup can use; it is much faster
+# than the pure-Python "html.parser" on large pages.
+try:
+    import lxml  # noqa: F401
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+
+# requests-cache is optional; when installed, GET responses are cached on disk
+# so article pages fetched on an earlier run skip the network.
+try:
+    import requests_cache
+
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+# Per-request cache lifetimes for _make_request's ``expire_after``. Published
+# press releases don't change, while listing pages gain new entries.
+NEVER_EXPIRE = -1  # Same sentinel as requests_cache.NEVER_EXPIRE
+DO_NOT_CACHE = 0  # Same sentinel as requests_cache.DO_NOT_CACHE
+LISTING_PAGE_EXPIRY = timedelta(hours=1)
+
+# Upper bound, in seconds, for a single retry backoff in _make_request
+_MAX_RETRY_BACKOFF = 30
+
+_HOST_SEMAPHORES: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+_HOST_RATE_LIMITERS: Dict[str, "_RateLimiter"] = {}
+_HOST_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+# Boilerplate stripped from an article body before its text is taken
+_UNWANTED_CONTENT_TAGS = ["script", "style", "nav", "aside", "footer", "header"]
+_UNWANTED_CONTENT_SELECTOR = soupsieve.compile(
+    ".social-share, .related-links, .tags, .breadcrumb"
+)
+
+
+def compile_selectors(*selectors: str) -> tuple:
+    """Compile CSS selectors once so extractors don't re-parse them per page."""
+    return tuple(soupsieve.compile(selector) for selector in selectors)
+
+
+def union_selector(selectors: tuple):
+    """Join ``compile_selectors`` output into one compiled comma selector."""
+    return soupsieve.compile(", ".join(selector.pattern for selector in selectors))
+
+
+def select_first_matches(tree, selectors: tuple, union) -> list:
+    """Return each selector's first match in ``tree``, in selector order.
+
+    Gives the same elements as ``select_one`` per selector, but walks the
+    tree once with ``union`` (from ``union_selector``) and picks each
+    selector's first match out of that result. Selectors that match nothing
+    are left out.
+    """
+    matches = union.select(tree)
+    found = []
+    for selector in selectors:
+        elem = next((match for match in matches if selector.match(match)), None)
+        if elem is not None:
+            found.append(elem)
+    return found
+
+
+@lru_cache(maxsize=None)
+def _shared_http_session(user_agent: str, cache_hours: int = 0) -> requests.Session:
+    """Return the process-wide HTTP session for a user agent.
+
+    Scrapers share one connection pool so keep-alive connections (and their
+    TLS handshakes) are reused across scrapers and scrape runs. Retries stay
+    in ``BaseScraper._make_request``, which applies its own backoff. With
+    requests-cache installed and ``cache_hours`` set, responses are also kept
+    in a SQLite cache in the application cache directory.
+    """
+    if HAS_REQUESTS_CACHE and cache_hours > 0:
+        from ..config.app_dirs import app_dirs
+
+        session = requests_cache.CachedSession(
+            cache_name=str(app_dirs.app_cache_dir / "http_cache"),
+            backend="sqlite",
+            expire_after=timedelta(hours=cache_hours),
+            allowable_methods=("GET",),
+            cache_control=True,
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": user_agent})
+    return session
+
+
+def _host_semaphore(url: str, limit: int) -> threading.BoundedSemaphore:
+    """Return the semaphore bounding concurrent requests to ``url``'s host.
+
+    Semaphores are process-wide, like the HTTP session, so the per-host limit
+    holds across every scraper and ``_fetch_many`` worker.
+    """
+    host = urlparse(url).netloc
+    with _HOST_SEMAPHORES_LOCK:
+        semaphore = _HOST_SEMAPHORES.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(limit)
+            _HOST_SEMAPHORES[host] = semaphore
+    return semaphore
+
+
+class _RateLimiter:
+    """Token bucket allowing ``rate`` acquisitions per second on average.
+
+    Up to ``capacity`` acquisitions go through back to back after an idle
+    spell; after that callers wait only as long as it takes a token to refill.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+            # Reserve the token up front so waiting callers are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _host_rate_limiter(url: str, rate: float, capacity: float) -> _RateLimiter:
+    """Return the rate limiter for ``url``'s host, shared process-wide."""
+    host = urlparse(url).netloc
+    with _HOST_RATE_LIMITERS_LOCK:
+        limiter = _HOST_RATE_LIMITERS.get(host)
+        if limiter is None:
+            limiter = _RateLimiter(rate, capacity)
+            _HOST_RATE_LIMITERS[host] = limiter
+    return limiter
+
+
+@lru_cache(maxsize=4096)
+def _resolve_against(base_url: str, url: str) -> str:
+    """Join ``url`` onto ``base_url``; listing pages repeat the same links."""
+    if url.startswith("http"):
+        return url
+    return urljoin(base_url, url)
+
+
+
+@lru_cache(maxsize=32)
+def _as_date(value):
+    """Return ``value`` as a date, parsing ``YYYY-MM-DD`` strings."""
+    if hasattr(value, "year"):
+        return value
+    return datetime.strptime(str(value), "%Y-%m-%d").date()
 
 class BaseScraper:
+    # Seconds allowed for scripts when an article page is rendered ahead of
+    # time by _prefetch_listing
+    _ARTICLE_RENDER_WAIT = 2
+
     def __init__(self, source_config: SourceConfig, scraping_config: ScrapingConfig):
         self.source_config = source_config
         self.scraping_config = scraping_config
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": scraping_config.user_agent})
+        self.session = _shared_http_session(
+            scraping_config.user_agent, scraping_config.http_cache_hours
+        )
         self.db_session = None
+        # Title hashes looked up by _prefetch_existing_titles and the subset stored
+        self._prefetched_title_hashes = set()
+        self._existing_title_hash_cache = set()
+        # Article page HTML fetched ahead of time by _prefetch_listing
+        self._article_page_cache = {}
+        # Article URLs whose HTTP fetch returned a block page; they are only
+        # rendered from then on, so the blocking host isn't asked again
+        self._blocked_article_urls = set()
+        # Article URLs already handled in the current scrape run, so a release
+        # listed on more than one page is only fetched and returned once.
+        # _prefetch_listing also adds URLs that are already in the database.
+        self._seen_article_urls = set()
+        # Extra drivers borrowed from the pool by _render_many; they are kept
+        # for the scraper's lifetime and handed back by _release_render_drivers
+        self._render_drivers = []
 
     def scrape_recent(self, days_back: int = 1):
         raise NotImplementedError
 
-    def _make_request(self, url: str, **kwargs) -> requests.Response:
-        """Make a rate-limited HTTP request."""
+    def _make_request(
+        self, url: str, expire_after=None, **kwargs
+    ) -> requests.Response:
+        """Make a rate-limited HTTP request.
+
+        ``expire_after`` overrides how long the response stays in the HTTP
+        cache; it is ignored when requests-cache isn't installed.
+        """
+        if expire_after is not None and HAS_REQUESTS_CACHE:
+            if isinstance(self.session, requests_cache.CachedSession):
+                kwargs["expire_after"] = expire_after
         response = None
+        host_semaphore = _host_semaphore(
+            url, self.scraping_config.max_concurrent_per_host
+        )
         for attempt in range(self.scraping_config.max_retries):
             try:
-                response = self.session.get(
-                    url, timeout=self.scraping_config.timeout, **kwargs
-                )
+                self._throttle(url)
+                with host_semaphore:
+                    response = self.session.get(
+                        url, timeout=self.scraping_config.timeout, **kwargs
+                    )
                 response.raise_for_status()
-
-                # Rate limiting
-                if attempt < self.scraping_config.max_retries - 1:
-                    time.sleep(self.scraping_config.delay_between_requests)
-
                 return response
 
             except requests.RequestException as e:
                 if attempt == self.scraping_config.max_retries - 1:
                     raise e
-                time.sleep(2**attempt)  # Exponential backoff
+                # A refusal or missing page won't change on retry; let the
+                # caller fall back (e.g. to ChromeDriver) straight away
+                status = e.response.status_code if e.response is not None else None
+                if status is not None and 400 <= status < 500 and status != 429:
+                    raise e
+                # Exponential backoff with full jitter so concurrent workers
+                # don't retry against the same host in lockstep
+                time.sleep(random.uniform(0, min(_MAX_RETRY_BACKOFF, 2**attempt)))
 
         return response
 
-    def _parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content."""
-        return BeautifulSoup(html, "html.parser")
+    def _throttle(self, url: str):
+        """Wait for a request slot under ``url``'s host rate limit.
+
+        Requests to a host are spaced ``delay_between_requests`` seconds
+        apart across every worker and scraper in the process, so running
+        workers concurrently never hits a host harder than one sequential
+        scraper sleeping that long between requests. Unlike that sleep, the
+        wait only happens when the next request would actually come too soon.
+        """
+        delay = self.scraping_config.delay_between_requests
+        if delay > 0:
+            _host_rate_limiter(url, 1 / delay, 1).acquire()
+
+    def _load_article_page(
+        self, url: str, render_wait: float, ready_selector: Optional[str] = None
+    ) -> str:
+        """Return the HTML of an article page.
+
+        Sources with ``article_pages_require_js`` render the page in the
+        scraper's ChromeDriver, waiting until ``ready_selector`` matches or,
+        without one, allowing ``render_wait`` seconds for scripts; otherwise
+        the page is fetched through the shared HTTP session, which skips the
+        browser round trip entirely. Scrapers that hold a driver still fall
+        back to rendering if that HTTP fetch fails.
+
+        Loaded pages go into ``_article_page_cache``, so extracting an
+        article's date and then its content costs a single page load.
+        """
+        cached_html = self._article_page_cache.get(url)
+        if cached_html is None:
+            cached_html = self._fetch_article_page(url, render_wait, ready_selector)
+            self._article_page_cache[url] = cached_html
+        return cached_html
+
+    def _fetch_article_page(
+        self, url: str, render_wait: float, ready_selector: Optional[str]
+    ) -> str:
+        """Load an article page for ``_load_article_page``, bypassing its cache."""
+        driver = getattr(self, "driver", None)
+        # A page the host already refused over HTTP goes straight to the driver
+        if (
+            not self.source_config.article_pages_require_js
+            and url not in self._blocked_article_urls
+        ):
+            try:
+                html = self._make_request(url, expire_after=NEVER_EXPIRE).text
+            except requests.RequestException:
+                if driver is None:
+                    raise
+                print(f"HTTP fetch of {url} failed, rendering it instead")
+            else:
+                if not self._is_blocked_page(html):
+                    return html
+                self._discard_cached_response(url)
+                self._blocked_article_urls.add(url)
+                if driver is None:
+                    raise requests.RequestException(f"Blocked page returned for {url}")
+                print(f"Blocked page returned for {url}, rendering it instead")
+        if driver is None:
+            raise RuntimeError(
+                f"Cannot render {url}: {self.source_config.name} has no ChromeDriver"
+            )
+        self._throttle(url)
+        driver.get(url)
+        if ready_selector:
+            wait_for_element(driver, ready_selector)
+        else:
+            time.sleep(render_wait)
+        return driver.page_source
+
+    def _is_blocked_page(self, html: str) -> bool:
+        """Return True if ``html`` is a block or error page served as a 200.
+
+        Sources whose CDN answers refused requests with an ordinary-looking
+        page override this, so such a page is neither cached nor parsed as
+        an article.
+        """
+        return False
+
+    def _discard_cached_response(self, url: str):
+        """Drop ``url`` from the HTTP cache when requests-cache is in use."""
+        if HAS_REQUESTS_CACHE and isinstance(
+            self.session, requests_cache.CachedSession
+        ):
+            try:
+                self.session.cache.delete(urls=[url])
+            except Exception as e:
+                print(f"Could not drop {url} from the HTTP cache: {e}")
+
+    def _select_content_text(self, soup, selectors: tuple) -> Optional[str]:
+        """Return the cleaned text of an article body.
+
+        ``selectors`` (from ``compile_selectors``) are tried in order of
+        preference until one matches an element with substantial text;
+        otherwise the text of the last match is returned.
+        """
+        content = None
+        for selector in selectors:
+            content_elem = selector.select_one(soup)
+            if content_elem:
+                # Remove unwanted elements
+                for unwanted in content_elem(_UNWANTED_CONTENT_TAGS):
+                    unwanted.decompose()
+
+                # Also remove social sharing, related links, etc.
+                for elem in _UNWANTED_CONTENT_SELECTOR.select(content_elem):
+                    elem.decompose()
+
+                content = self._clean_text(content_elem.get_text())
+
+                # Check if we got substantial content (at least 100 characters)
+                if content and len(content.strip()) > 100:
+                    break
+        return content
+
+    def _fetch_many(
+        self, urls: List[str], max_concurrency: int = 8, expire_after=None
+    ) -> List[Optional[requests.Response]]:
+        """Fetch several URLs concurrently through ``_make_request``.
+
+        Requests share the pooled session and are bounded by
+        ``max_concurrency``. Results are returned in the order of ``urls``;
+        a URL that still fails after retries yields ``None``.
+        """
+        if not urls:
+            return []
+
+        def fetch(url: str) -> Optional[requests.Response]:
+            try:
+                return self._make_request(url, expire_after=expire_after)
+            except requests.RequestException as e:
+                print(f"Error fetching {url}: {e}")
+                return None
+
+        max_workers = min(max_concurrency, len(urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, urls))
+
+    def _parse_html(
+        self, html: str, parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        """Parse HTML content.
+
+        With ``parse_only``, only matching elements (and their descendants)
+        are built into the tree, which is much cheaper when a caller needs
+        one table out of a large page.
+        """
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
         if not text:
             return ""
-        return " ".join(text.strip().split())
+        # split() with no argument already drops leading/trailing whitespace
+        return " ".join(text.split())
 
     def _resolve_url(self, url: str) -> str:
         """Resolve relative URLs to absolute URLs."""
-        if url.startswith("http"):
-            return url
-        return urljoin(self.source_config.base_url, url)
+        return _resolve_against(self.source_config.base_url, url)
 
     def _is_recent(self, published_date: datetime, days_back: int) -> bool:
         """Check if an article is within the lookback period."""
         cutoff_date = datetime.now() - timedelta(days=days_back)
         return published_date >= cutoff_date
 
+    def _is_date_in_range(self, date: datetime, start_date, end_date) -> bool:
+        """Check if a date falls within the specified range."""
+        if not date:
+            return False
+
+        # Convert to date objects for comparison; the bounds are the same for
+        # every article in a scrape, so string bounds are parsed only once
+        date_obj = date.date() if hasattr(date, "date") else date
+        return _as_date(start_date) <= date_obj <= _as_date(end_date)
+
     def _generate_title_hash(self, title: str) -> str:
         """Generate a unique hash for the article title."""
         # Normalize title: strip whitespace, convert to lowercase
-        normalized_title = title.strip().lower()
-        return hashlib.sha256(normalized_title.encode("utf-8")).hexdigest()
+        return generate_title_hash(title)
 
-    def _article_exists_by_title(self, title: str) -> bool:
-        """Check if an article with this title already exists in the database."""
+    def _existing_title_hashes(self, titles) -> set:
+        """Return the hashes of ``titles`` already in the database, in one query."""
         if not self.db_session:
-            return False
+            return set()
+
+        title_hashes = {self._generate_title_hash(title) for title in titles if title}
+        if not title_hashes:
+            return set()
 
         try:
             from ..database.models import Article as DBArticle
 
-            # Check if article exists by exact title match
-            existing = (
-                self.db_session.query(DBArticle)
-                .filter(DBArticle.title == title.strip())
-                .first()
+            rows = self.db_session.query(DBArticle.title_hash).filter(
+                DBArticle.title_hash.in_(title_hashes)
             )
+            return {row[0] for row in rows}
+
+        except Exception as e:
+            print(f"Error checking article existence: {e}")
+            return set()
 
-            return existing is not None
+    def _existing_article_urls(self, urls) -> set:
+        """Return the subset of ``urls`` already in the database, in one query."""
+        urls = set(urls)
+        if not self.db_session or not urls:
+            return set()
+
+        try:
+            from ..database.models import Article as DBArticle
+
+            rows = self.db_session.query(DBArticle.url).filter(
+                DBArticle.url.in_(urls)
+            )
+            return {row[0] for row in rows}
 
         except Exception as e:
             print(f"Error checking article existence: {e}")
+            return set()
+
+    def _prefetch_existing_titles(self, titles):
+        """Look up a page of titles at once so per-article checks skip the DB."""
+        titles = [title for title in titles if title]
+        self._prefetched_title_hashes = {
+            self._generate_title_hash(title) for title in titles
+        }
+        self._existing_title_hash_cache = self._existing_title_hashes(titles)
+
+    def _prefetch_listing(self, entries):
+        """Prefetch what a listing page's per-item loop is going to need.
+
+        ``entries`` are ``(title, href)`` pairs for the page's items. Titles
+        and URLs are checked against the database in one query each, then
+        pages of the new articles are fetched concurrently into
+        ``_article_page_cache`` -- over HTTP, or rendered in several
+        ChromeDrivers for sources whose article pages need a browser.
+        """
+        entries = [(title, href) for title, href in entries if title]
+        self._prefetch_existing_titles(title for title, _ in entries)
+        self._article_page_cache = {}
+
+        new_urls = list(
+            dict.fromkeys(
+                self._resolve_url(href)
+                for title, href in entries
+                if href and not self._article_exists_by_title(title)
+            )
+        )
+        # A stored article can come back under an edited title; its URL is
+        # unique in the database, so skip it before any page is fetched
+        stored_urls = self._existing_article_urls(new_urls)
+        if stored_urls:
+            self._seen_article_urls.update(stored_urls)
+            new_urls = [url for url in new_urls if url not in stored_urls]
+        if self.source_config.article_pages_require_js:
+            pages = self._render_many(new_urls)
+        else:
+            responses = self._fetch_many(new_urls, expire_after=NEVER_EXPIRE)
+            pages = []
+            for url, response in zip(new_urls, responses):
+                html = response.text if response is not None else None
+                if html is not None and self._is_blocked_page(html):
+                    # Leave it to _load_article_page, which renders it
+                    self._discard_cached_response(url)
+                    self._blocked_article_urls.add(url)
+                    html = None
+                pages.append(html)
+        self._article_page_cache = {
+            url: html for url, html in zip(new_urls, pages) if html is not None
+        }
+
+    def _render_many(self, urls: List[str]) -> List[Optional[str]]:
+        """Render several pages concurrently in ChromeDriver.
+
+        The scraper's own driver is joined by up to
+        ``max_concurrent_per_host - 1`` drivers borrowed from the shared pool.
+        Borrowed drivers stay with the scraper, so later listing pages reuse
+        them warm, until ``_release_render_drivers`` is called on close.
+        Results are returned in the order of ``urls``; a page that fails to
+        load yields ``None``.
+        """
+        if not urls or getattr(self, "driver", None) is None:
+            return [None] * len(urls)
+
+        max_drivers = min(len(urls), self.scraping_config.max_concurrent_per_host)
+        while len(self._render_drivers) < max_drivers - 1:
+            # These drivers only load pages, so they can skip stylesheets
+            driver = chrome_driver_pool.acquire(
+                self.source_config.name, block_stylesheets=True
+            )
+            if driver is None:
+                break
+            self._render_drivers.append(driver)
+
+        drivers = queue.Queue()
+        drivers.put(self.driver)
+        for driver in self._render_drivers[: max_drivers - 1]:
+            drivers.put(driver)
+
+        def render(url: str) -> Optional[str]:
+            driver = drivers.get()
+            try:
+                self._throttle(url)
+                driver.get(url)
+                time.sleep(self._ARTICLE_RENDER_WAIT)
+                return driver.page_source
+            except WebDriverException as e:
+                print(f"Error rendering {url}: {e}")
+                return None
+            finally:
+                drivers.put(driver)
+
+        with ThreadPoolExecutor(max_workers=drivers.qsize()) as executor:
+            return list(executor.map(render, urls))
+
+    def _release_render_drivers(self):
+        """Return the drivers borrowed by ``_render_many`` to the shared pool."""
+        drivers, self._render_drivers = self._render_drivers, []
+        for driver in drivers:
+            chrome_driver_pool.release(self.source_config.name, driver)
+
+    def _article_exists_by_title(self, title: str) -> bool:
+        """Check if an article with this title already exists in the database."""
+        if not self.db_session:
             return False
+
+        title_hash = self._generate_title_hash(title)
+        if title_hash in self._prefetched_title_hashes:
+            return title_hash in self._existing_title_hash_cache
+
+        return title_hash in self._existing_title_hashes([title])
@@ -1,22 +1,34 @@
 """Commodity Futures Trading Commission press release scraper."""
 
+import copy
 import logging
+import queue
+import threading
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Optional
-import time
 
+from bs4 import SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException
+from sqlalchemy.orm import Session
 from webdriver_manager.chrome import ChromeDriverManager
 
-from .base import BaseScraper
-from ._common import setup_chrome_options, log_safe_content, initialize_chrome_driver
+from .base import (
+    BaseScraper,
+    LISTING_PAGE_EXPIRY,
+    NEVER_EXPIRE,
+    compile_selectors,
+)
+from ._common import (
+    setup_chrome_options,
+    log_safe_content,
+    chrome_driver_pool,
+    wait_for_element,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,14 +36,38 @@ logger = logging.getLogger(__name__)
 class CFTCScraper(BaseScraper):
     """Scraper for CFTC press releases using Selenium."""
 
+    # CFTC-specific content selectors (in order of preference)
+    _CONTENT_SELECTORS = compile_selectors(
+        ".field--name-body",  # Main body field
+        ".node-content",  # Node content wrapper
+        ".region-content",  # Content region
+        "#main-content",  # Main content area
+        ".page-content",  # Page content
+        "main",  # HTML5 main element
+        "article .content",  # Article content
+    )
+
+    # Class of the server-rendered press release table on listing pages
+    _LISTING_TABLE_CLASS = "table table-hover table-striped"
+    _LISTING_ROW_SELECTOR = "table.table.table-hover.table-striped tbody tr"
+    # Listing pages only need that table, so the rest isn't parsed
+    _LISTING_TABLE_STRAINER = SoupStrainer("table", class_=_LISTING_TABLE_CLASS)
+
+    # Upper bound on years scraped at once, each on its own ChromeDriver
+    _MAX_YEAR_WORKERS = 3
+
     def __init__(self, source_config, scraping_config):
         super().__init__(source_config, scraping_config)
+        # Year workers share _seen_article_urls; this guards its check-and-add
+        self._seen_article_urls_lock = threading.Lock()
 
-        # Initialize ChromeDriver using the common helper function
-        self.driver = initialize_chrome_driver(self.source_config.name)
+        # Take a warm ChromeDriver from the shared pool, or initialize a new one
+        # (CFTC pages are only read, never clicked, so stylesheets can go)
+        self.driver = chrome_driver_pool.acquire(
+            self.source_config.name, block_stylesheets=True
+        )
         
         if self.driver:
-            self.driver.implicitly_wait(10)
             logger.debug(f"ChromeDriver session ID: {self.driver.session_id}")
             
             # Use weakref.finalize for more reliable cleanup
@@ -50,14 +86,16 @@ class CFTCScraper(BaseScraper):
                 logger.warning(f"Error in finalizer cleanup: {e}")
 
     def close(self):
-        """Explicitly close the WebDriver."""
+        """Explicitly release the WebDrivers back to the shared driver pool."""
+        self._release_render_drivers()
         if hasattr(self, "driver") and self.driver:
             try:
                 logger.debug(f"Closing ChromeDriver for {self.source_config.name}")
                 # Cancel the finalizer since we're explicitly closing
                 if hasattr(self, "_finalizer"):
                     self._finalizer.detach()
-                self.driver.quit()
+                # Hand the session back to the pool for the next scrape run
+                chrome_driver_pool.release(self.source_config.name, self.driver)
                 self.driver = None
             except Exception as e:
                 logger.warning(
@@ -98,7 +136,9 @@ class CFTCScraper(BaseScraper):
             return []
         
         articles = []
-        
+        # Shared by reference with the year workers spawned below
+        self._seen_article_urls = set()
+
         # Convert dates to date objects for comparison
         start_obj = (
             start_date
@@ -120,26 +160,46 @@ class CFTCScraper(BaseScraper):
             # Generate list of years to scrape
             years_to_scrape = self._generate_years_range(start_obj, end_obj)
 
-            for year in years_to_scrape:
+            # WebDriver sessions aren't thread-safe, so each concurrent year
+            # borrows a whole worker (this scraper or a copy with its own
+            # driver and DB session) from a queue and hands it back after
+            workers = queue.Queue()
+            workers.put(self)
+            spawned_workers = []
+            for _ in range(min(len(years_to_scrape), self._MAX_YEAR_WORKERS) - 1):
+                worker = self._spawn_year_worker()
+                if worker is None:
+                    break
+                spawned_workers.append(worker)
+                workers.put(worker)
+
+            def scrape_year(year):
+                worker = workers.get()
                 try:
                     msg = f"Scraping CFTC releases for {year}"
                     logger.info(msg)
                     if progress_callback:
                         progress_callback(msg)
 
-                    year_articles = self._scrape_year(
+                    year_articles = worker._scrape_year(
                         year, start_obj, end_obj, progress_callback
                     )
-                    articles.extend(year_articles)
-
                     logger.info(f"Found {len(year_articles)} articles for {year}")
+                    return year_articles
 
-                    # Add delay between year requests to be respectful
-                    time.sleep(2)
-                    
                 except Exception as e:
                     logger.error(f"Error scraping CFTC for {year}: {e}")
-                    continue
+                    return []
+                finally:
+                    workers.put(worker)
+
+            try:
+                with ThreadPoolExecutor(max_workers=workers.qsize()) as executor:
+                    for year_articles in executor.map(scrape_year, years_to_scrape):
+                        articles.extend(year_articles)
+            finally:
+                for worker in spawned_workers:
+                    self._retire_year_worker(worker)
 
             logger.info(
                 f"CFTC scraper found {len(articles)} total articles in date range"
@@ -152,6 +212,34 @@ class CFTCScraper(BaseScraper):
                 progress_callback(f"Error in CFTC scraping: {e}")
             return []
 
+    def _spawn_year_worker(self):
+        """Return a copy of this scraper with its own driver and DB session.
+
+        Returns None when no additional ChromeDriver can be started.
+        """
+        driver = chrome_driver_pool.acquire(
+            self.source_config.name, block_stylesheets=True
+        )
+        if driver is None:
+            return None
+
+        worker = copy.copy(self)
+        worker.driver = driver
+        worker._prefetched_title_hashes = set()
+        worker._existing_title_hash_cache = set()
+        worker._article_page_cache = {}
+        worker._render_drivers = []
+        if self.db_session is not None:
+            worker.db_session = Session(bind=self.db_session.get_bind())
+        return worker
+
+    def _retire_year_worker(self, worker):
+        """Close a worker's DB session and return its drivers to the pool."""
+        if worker.db_session is not None:
+            worker.db_session.close()
+        worker._release_render_drivers()
+        chrome_driver_pool.release(self.source_config.name, worker.driver)
+
     def _generate_years_range(self, start_date, end_date):
         """Generate list of years to scrape."""
         years = []
@@ -165,112 +253,11 @@ class CFTCScraper(BaseScraper):
         return years
 
     def _scrape_year(self, year, start_date, end_date, progress_callback=None):
-        """Scrape CFTC press releases for a specific year."""
-        articles = []
+        """Scrape CFTC press releases for a specific year.
 
-        try:
-            # Navigate to the CFTC press releases page
-            press_url = "https://www.cftc.gov/PressRoom/PressReleases"
-            logger.info(f"Loading CFTC press releases page: {press_url}")
-            self.driver.get(press_url)
-            time.sleep(3)  # Wait for page to load
-
-            # Click on "Show filters" to reveal filtering options
-            try:
-                logger.debug("Looking for 'Show filters' button")
-                show_filters_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.CLASS_NAME, "show-filters"))
-                )
-                logger.debug("Clicking 'Show filters' button")
-                show_filters_button.click()
-                time.sleep(2)  # Wait for filters to appear
-
-            except TimeoutException:
-                logger.warning(
-                    "Could not find 'Show filters' button, trying direct URL approach"
-                )
-                return self._scrape_direct_url(
-                    year, start_date, end_date, progress_callback
-                )
-
-            # Now apply year filter - we'll use direct URL approach since it's more reliable
-            filtered_url = f"{press_url}?combine=&field_press_release_types_value=All&field_release_number_value=&prtid=All&year={year}"
-            logger.info(f"Using filtered URL: {filtered_url}")
-            self.driver.get(filtered_url)
-            time.sleep(3)
-
-            # Now scrape the filtered results
-            page = 0
-            while True:
-                # If not first page, add page parameter
-                if page > 0:
-                    current_url = self.driver.current_url
-                    separator = "&" if "?" in current_url else "?"
-                    paginated_url = f"{current_url}{separator}page={page}"
-                    logger.info(f"Loading page {page + 1}: {paginated_url}")
-                    self.driver.get(paginated_url)
-                    time.sleep(3)
-
-                # Parse the page
-                soup = self._parse_html(self.driver.page_source)
-
-                # Look for press release table
-                # Based on your info: class="table table-hover table-striped"
-                press_release_table = soup.find(
-                    "table", class_="table table-hover table-striped"
-                )
-
-                if not press_release_table:
-                    logger.info(f"No press release table found on page {page + 1}")
-                    break
-
-                # Find all rows in the table body
-                table_rows = press_release_table.find("tbody")
-                if not table_rows:
-                    logger.info(f"No table body found on page {page + 1}")
-                    break
-
-                rows = table_rows.find_all("tr")
-                if not rows:
-                    logger.info(f"No table rows found on page {page + 1}")
-                    break
-                    
-                page_articles = []
-                for row in rows:
-                    try:
-                        article = self._extract_article_from_row(
-                            row, start_date, end_date
-                        )
-                        if article:
-                            page_articles.append(article)
-                    except Exception as e:
-                        logger.debug(f"Error processing CFTC press release row: {e}")
-                        continue
-                    
-                articles.extend(page_articles)
-                logger.info(
-                    f"Processed {len(rows)} rows on page {page + 1}, found {len(page_articles)} articles"
-                )
-                    
-                # Check if we should continue to next page
-                if len(rows) == 0:
-                    break
-                        
-                page += 1
-            
-                # Safety limit to prevent infinite loops
-                if page > 10:
-                    logger.warning("Reached safety limit of 10 pages for CFTC")
-                    break
-            
-            return articles
-            
-        except Exception as e:
-            logger.error(f"Error scraping CFTC for {year}: {e}")
-            return articles
-    
-    def _scrape_direct_url(self, year, start_date, end_date, progress_callback=None):
-        """Fallback method using direct URL construction."""
+        The listing is loaded straight from its year-filtered URL; the search
+        form on the landing page builds the same query string.
+        """
         articles = []
 
         try:
@@ -278,26 +265,23 @@ class CFTCScraper(BaseScraper):
             press_url = "https://www.cftc.gov/PressRoom/PressReleases"
             filtered_url = f"{press_url}?combine=&field_press_release_types_value=All&field_release_number_value=&prtid=All&year={year}"
 
-            logger.info(f"Using direct URL approach: {filtered_url}")
-            self.driver.get(filtered_url)
-            time.sleep(5)  # Wait for page to load
+            logger.info(f"Using filtered URL: {filtered_url}")
 
             # Now scrape the filtered results
             page = 0
             while True:
                 # If not first page, add page parameter
+                page_url = filtered_url
                 if page > 0:
-                    paginated_url = f"{filtered_url}&page={page}"
-                    logger.info(f"Loading page {page + 1}: {paginated_url}")
-                    self.driver.get(paginated_url)
-                    time.sleep(3)
+                    page_url = f"{filtered_url}&page={page}"
+                    logger.info(f"Loading page {page + 1}: {page_url}")
 
                 # Parse the page
-                soup = self._parse_html(self.driver.page_source)
+                soup = self._load_listing_soup(page_url, year)
 
                 # Look for press release table
                 press_release_table = soup.find(
-                    "table", class_="table table-hover table-striped"
+                    "table", class_=self._LISTING_TABLE_CLASS
                 )
 
                 if not press_release_table:
@@ -316,6 +300,7 @@ class CFTCScraper(BaseScraper):
                     break
 
                 page_articles = []
+                self._prefetch_listing_rows(rows, start_date, end_date)
                 for row in rows:
                     try:
                         article = self._extract_article_from_row(
@@ -336,6 +321,13 @@ class CFTCScraper(BaseScraper):
                 if len(rows) == 0:
                     break
 
+                # Listings run newest first, so once a page reaches dates
+                # before the range every later page is out of range too
+                oldest_date = self._row_date(rows[-1])
+                if oldest_date and oldest_date.date() < start_date:
+                    logger.info(f"Reached releases before {start_date}, stopping")
+                    break
+
                 page += 1
 
                 # Safety limit to prevent infinite loops
@@ -346,9 +338,78 @@ class CFTCScraper(BaseScraper):
             return articles
             
         except Exception as e:
-            logger.error(f"Error in direct URL scraping for CFTC {year}: {e}")
+            logger.error(f"Error scraping CFTC for {year}: {e}")
             return articles
 
+    def _load_listing_soup(self, url, year):
+        """Return the parsed listing page at ``url``.
+
+        The press release table is server-rendered, so the page is fetched
+        over plain HTTP first. ChromeDriver is only used, waiting for the
+        table's rows to appear, when that fetch fails or comes back without
+        the table (e.g. a bot-check page).
+
+        Listings for past years no longer change and stay in the HTTP cache;
+        the current year's are refetched once ``LISTING_PAGE_EXPIRY`` passes.
+        """
+        if year < datetime.now().year:
+            expire_after = NEVER_EXPIRE
+        else:
+            expire_after = LISTING_PAGE_EXPIRY
+        try:
+            response = self._make_request(url, expire_after=expire_after)
+            soup = self._parse_html(response.text, self._LISTING_TABLE_STRAINER)
+            if soup.find("table", class_=self._LISTING_TABLE_CLASS):
+                return soup
+            logger.info(f"No press release table in static HTML of {url}")
+        except Exception as e:
+            logger.info(f"Static fetch of {url} failed: {e}")
+
+        logger.info(f"Rendering {url} in ChromeDriver instead")
+        self._throttle(url)
+        self.driver.get(url)
+        wait_for_element(self.driver, self._LISTING_ROW_SELECTOR)
+        return self._parse_html(
+            self.driver.page_source, self._LISTING_TABLE_STRAINER
+        )
+
+    @staticmethod
+    def _find_title_link(cells):
+        """Return the first link in a row's cells, which carries the title."""
+        for cell in cells:
+            link = cell.find("a")
+            if link:
+                return link
+        return None
+
+    def _row_date(self, row) -> Optional[datetime]:
+        """Return the publication date in a listing row's first cell."""
+        date_cell = row.find("td")
+        if not date_cell:
+            return None
+        return self._parse_date(self._clean_text(date_cell.get_text()))
+
+    def _prefetch_listing_rows(self, rows, start_date, end_date):
+        """Prefetch title checks and article pages for a listing page.
+
+        Only rows dated within the range and not already seen this run are
+        prefetched, so a page that is mostly outside the range (or repeats
+        releases from an earlier page) doesn't trigger wasted article fetches.
+        """
+        entries = []
+        for row in rows:
+            cells = row.find_all("td")
+            link = self._find_title_link(cells)
+            href = link.get("href") if link else None
+            if not href or self._resolve_url(href) in self._seen_article_urls:
+                continue
+            published_date = self._row_date(row)
+            if published_date and self._is_date_in_range(
+                published_date, start_date, end_date
+            ):
+                entries.append((self._clean_text(link.get_text()), href))
+        self._prefetch_listing(entries)
+
     def _extract_article_from_row(self, row, start_date, end_date):
         """Extract article data from a CFTC press release table row."""
         try:
@@ -359,15 +420,8 @@ class CFTCScraper(BaseScraper):
     
             # Typically CFTC tables have: Date | Title | Release Number
             # Find the title cell (usually contains a link)
-            title_elem = None
-            url = None
-
-            for cell in cells:
-                link = cell.find("a")
-                if link:
-                    title_elem = link
-                    url = self._resolve_url(link.get("href"))
-                    break
+            title_elem = self._find_title_link(cells)
+            url = self._resolve_url(title_elem.get("href")) if title_elem else None
 
             if not title_elem or not url:
                 return None
@@ -393,6 +447,16 @@ class CFTCScraper(BaseScraper):
                 logger.debug(f"Article already exists: {title}...")
                 return None
 
+            # Skip releases already picked up from another row, page or year;
+            # the check and the claim happen under one lock so two year
+            # workers can't both take the same release
+            with self._seen_article_urls_lock:
+                already_seen = url in self._seen_article_urls
+                self._seen_article_urls.add(url)
+            if already_seen:
+                logger.debug(f"Article already scraped: {url}")
+                return None
+
             # Extract release number if available (usually in last cell)
             release_number = None
             if len(cells) > 2:
@@ -417,74 +481,16 @@ class CFTCScraper(BaseScraper):
             logger.error(f"Error extracting article from CFTC row: {e}")
             return None
 
-    def _is_date_in_range(self, date: datetime, start_date, end_date) -> bool:
-        """Check if a date falls within the specified range."""
-        if not date:
-            return False
-
-        # Convert to date objects for comparison
-        date_obj = date.date() if hasattr(date, "date") else date
-        start_obj = (
-            start_date
-            if hasattr(start_date, "year")
-            else datetime.strptime(str(start_date), "%Y-%m-%d").date()
-        )
-        end_obj = (
-            end_date
-            if hasattr(end_date, "year")
-            else datetime.strptime(str(end_date), "%Y-%m-%d").date()
-        )
-
-        return start_obj <= date_obj <= end_obj
-
     def _extract_full_content(self, url: str) -> Optional[str]:
         """Extract full content from a CFTC press release page."""
         try:
             logger.info(f"Loading full content from: {url}")
-            self.driver.get(url)
-            
-            # Wait for page to load
-            time.sleep(2)
-            
-            # Get page source and parse with BeautifulSoup
-            soup = self._parse_html(self.driver.page_source)
-
-            # CFTC-specific content selectors (in order of preference)
-            content_selectors = [
-                ".field--name-body",  # Main body field
-                ".node-content",  # Node content wrapper
-                ".region-content",  # Content region
-                "#main-content",  # Main content area
-                ".page-content",  # Page content
-                "main",  # HTML5 main element
-                "article .content",  # Article content
-            ]
-
-            content = None
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    # Remove unwanted elements
-                    for unwanted in content_elem(
-                        ["script", "style", "nav", "aside", "footer", "header"]
-                    ):
-                        unwanted.decompose()
-
-                    # Also remove social sharing, related links, etc.
-                    for unwanted_class in [
-                        ".social-share",
-                        ".related-links",
-                        ".tags",
-                        ".breadcrumb",
-                    ]:
-                        for elem in content_elem.select(unwanted_class):
-                            elem.decompose()
-
-                    content = self._clean_text(content_elem.get_text())
-
-                    # Check if we got substantial content (at least 100 characters)
-                    if content and len(content.strip()) > 100:
-                        break
+            html = self._load_article_page(
+                url, render_wait=2, ready_selector=".field--name-body"
+            )
+            soup = self._parse_html(html)
+
+            content = self._select_content_text(soup, self._CONTENT_SELECTORS)
 
             if not content or len(content.strip()) < 50:
                 logger.warning(f"Insufficient content extracted from {url}")
@@ -5,8 +5,8 @@ import weakref
 from datetime import datetime, timedelta
 from typing import List, Optional
 from urllib.parse import urljoin, urlencode
-import time
 
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -16,23 +16,66 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
-from .base import BaseScraper
-from ._common import setup_chrome_options, log_safe_content, initialize_chrome_driver
+from ..utils.timezone_utils import parse_iso_datetime_to_utc
+from .base import (
+    BaseScraper,
+    LISTING_PAGE_EXPIRY,
+    compile_selectors,
+    select_first_matches,
+    union_selector,
+)
+from ._common import (
+    setup_chrome_options,
+    log_safe_content,
+    chrome_driver_pool,
+    wait_for_element,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class DOJScraper(BaseScraper):
     """Scraper for Department of Justice press releases using Selenium."""
+
+    # DOJ-specific content selectors (in order of preference)
+    _CONTENT_SELECTORS = compile_selectors(
+        ".field--name-body",  # Main body field
+        ".field--name-field-pr-body",  # Press release body
+        ".node-content",  # Node content wrapper
+        ".region-content",  # Content region
+        "#main-content",  # Main content area
+        ".page-content",  # Page content
+        "main",  # HTML5 main element
+        "article .content",  # Article content
+    )
+    # Elements that carry an article page's publication date
+    _DATE_SELECTORS = compile_selectors(
+        "time[datetime]", ".date-display-single", ".submitted"
+    )
+    # Elements that carry a listing item's publication date
+    _ITEM_DATE_SELECTORS = compile_selectors(
+        "time[datetime]",
+        ".date-display-single",
+        ".submitted",
+        ".node__meta time",
+        ".field--name-created time",
+    )
+    # The date selectors joined, so each lookup walks the tree once
+    _DATE_SELECTOR_UNION = union_selector(_DATE_SELECTORS)
+    _ITEM_DATE_SELECTOR_UNION = union_selector(_ITEM_DATE_SELECTORS)
     
+    # Press release items on a listing page
+    _LISTING_ITEM_SELECTOR = "div.views-row, article.node"
+    # Elements whose presence means a rendered article page is ready to read
+    _CONTENT_READY_SELECTOR = ".field--name-body, .field--name-field-pr-body"
+
     def __init__(self, source_config, scraping_config):
         super().__init__(source_config, scraping_config)
         
-        # Initialize ChromeDriver using the common helper function
-        self.driver = initialize_chrome_driver(self.source_config.name)
+        # Take a warm ChromeDriver from the shared pool, or initialize a new one
+        self.driver = chrome_driver_pool.acquire(self.source_config.name)
         
         if self.driver:
-            self.driver.implicitly_wait(10)
             logger.debug(f"ChromeDriver session ID: {self.driver.session_id}")
             
             # Use weakref.finalize for more reliable cleanup
@@ -51,14 +94,16 @@ class DOJScraper(BaseScraper):
                 logger.warning(f"Error in finalizer cleanup: {e}")
     
     def close(self):
-        """Explicitly close the WebDriver."""
+        """Explicitly release the WebDrivers back to the shared driver pool."""
+        self._release_render_drivers()
         if hasattr(self, "driver") and self.driver:
             try:
                 logger.debug(f"Closing ChromeDriver for {self.source_config.name}")
                 # Cancel the finalizer since we're explicitly closing
                 if hasattr(self, "_finalizer"):
                     self._finalizer.detach()
-                self.driver.quit()
+                # Hand the session back to the pool for the next scrape run
+                chrome_driver_pool.release(self.source_config.name, self.driver)
                 self.driver = None
             except Exception as e:
                 logger.warning(
@@ -101,6 +146,10 @@ class DOJScraper(BaseScraper):
                 return True
         return False
 
+    def _is_blocked_page(self, html: str) -> bool:
+        """Treat the CDN's Access Denied page as blocked, not as an article."""
+        return self._check_access_denied(html)
+
     def scrape_date_range(self, start_date, end_date, progress_callback=None):
         """Scrape DOJ press releases for a specific date range using date filtering."""
         logger.debug(
@@ -116,7 +165,8 @@ class DOJScraper(BaseScraper):
             return []
         
         articles = []
-        
+        self._seen_article_urls = set()
+
         # Convert dates to date objects for comparison
         start_obj = (
             start_date
@@ -142,6 +192,8 @@ class DOJScraper(BaseScraper):
             logger.warning(msg)
             if progress_callback:
                 progress_callback(msg)
+            # Articles from the failed pass are discarded, so start afresh
+            self._seen_article_urls = set()
             return self._scrape_with_pagination_fallback(
                 start_obj, end_obj, progress_callback
             )
@@ -157,8 +209,7 @@ class DOJScraper(BaseScraper):
         # Navigate to the press releases page
         press_url = "https://www.justice.gov/news/press-releases"
         self.driver.get(press_url)
-        time.sleep(3)  # Wait for page to load
-        
+
         try:
             # Format dates for the form (MM/DD/YYYY format expected)
             start_str = start_date.strftime("%m/%d/%Y")
@@ -174,7 +225,6 @@ class DOJScraper(BaseScraper):
             start_input.clear()
             start_input.send_keys(start_str)
             logger.debug(f"Start date set to: {start_str}")
-            time.sleep(1)
             
             # Find and fill end date
             logger.debug("Finding end date element...")
@@ -184,7 +234,6 @@ class DOJScraper(BaseScraper):
             end_input.clear()
             end_input.send_keys(end_str)
             logger.debug(f"End date set to: {end_str}")
-            time.sleep(1)
             
             # Click search button
             logger.debug("Clicking search button...")
@@ -194,9 +243,14 @@ class DOJScraper(BaseScraper):
             search_button.click()
             logger.debug("Search button clicked")
             
-            # Wait for results to load and record the current URL
+            # Wait for the results page to replace the form, then for its items
+            # (a search with no results has none, so that wait may time out)
             logger.debug("Waiting for filtered results...")
-            time.sleep(5)
+            try:
+                WebDriverWait(self.driver, 15).until(EC.staleness_of(search_button))
+            except TimeoutException:
+                logger.debug("Search form still attached; results may be in place")
+            wait_for_element(self.driver, self._LISTING_ITEM_SELECTOR)
             
             # Record the base URL after filtering is applied
             base_url = self.driver.current_url
@@ -215,14 +269,17 @@ class DOJScraper(BaseScraper):
                     current_url = f"{base_url}{separator}page={page}"
                 
                 logger.info(f"Loading page {page + 1}: {current_url}")
-                self.driver.get(current_url)
-                time.sleep(3)  # Wait for page to load
-                
+                if page == 0:
+                    # The search left the first page of results in the driver
+                    html = self.driver.page_source
+                else:
+                    html = self._load_listing_html(current_url)
+
                 # Check for access denied after loading each page
-                if self._check_access_denied(self.driver.page_source):
+                if self._check_access_denied(html):
                     raise Exception(f"Access denied detected on page {page + 1} - triggering fallback")
-                
-                soup = self._parse_html(self.driver.page_source)
+
+                soup = self._parse_html(html)
                 items = soup.find_all("div", class_="views-row") or soup.find_all(
                     "article", class_="node"
                 )
@@ -238,7 +295,21 @@ class DOJScraper(BaseScraper):
                 logger.info(
                     f"Processed {len(items)} items on page {page + 1}, found {len(page_articles)} new articles"
                 )
-                
+
+                # A page shorter than the first one is the last page
+                if page == 0:
+                    page_size = len(items)
+                elif len(items) < page_size:
+                    logger.info(f"Page {page + 1} is the last page of results")
+                    break
+
+                # Listings run newest first; should the filter not have been
+                # applied, stop once they predate the range
+                oldest_date = self._extract_date_from_item(items[-1])
+                if oldest_date and oldest_date.date() < start_date:
+                    logger.info(f"Reached releases before {start_date}, stopping")
+                    break
+
                 page += 1
                 
                 # Safety limit to prevent infinite loops
@@ -256,52 +327,39 @@ class DOJScraper(BaseScraper):
     def _scrape_with_pagination_fallback(
         self, start_date, end_date, progress_callback=None
     ):
-        """Fallback method using pagination and local date filtering."""
+        """Fallback method using pagination and local date filtering.
+
+        ``start_date`` and ``end_date`` are dates, already normalized by
+        ``scrape_date_range``.
+        """
         articles = []
         page = 0
-        
-        # Parse date objects for comparison
-        start_obj = (
-            start_date
-            if hasattr(start_date, "year")
-            else datetime.strptime(str(start_date), "%Y-%m-%d").date()
-        )
-        end_obj = (
-            end_date
-            if hasattr(end_date, "year")
-            else datetime.strptime(str(end_date), "%Y-%m-%d").date()
-        )
-        
+
         logger.info("Using pagination fallback method...")
         
         # Load the initial press releases page
         press_url = "https://www.justice.gov/news/press-releases"
         logger.info(f"Loading initial page: {press_url}")
-        self.driver.get(press_url)
-        time.sleep(3)
-        
+        html = self._load_listing_html(press_url)
+
         # Check for access denied on initial fallback page load
-        if self._check_access_denied(self.driver.page_source):
+        if self._check_access_denied(html):
             raise Exception("Access denied detected on initial fallback page load - no more fallback options")
-        
+
         while True:
             try:
-                # Construct the URL for the current page
-                if page == 0:
-                    current_url = press_url
-                else:
+                # The initial load above is the first page
+                if page > 0:
                     current_url = f"{press_url}?page={page}"
-                
-                logger.info(f"Loading fallback page {page + 1}: {current_url}")
-                self.driver.get(current_url)
-                time.sleep(3)  # Wait for page to load
-                
-                # Check for access denied after loading each fallback page
-                if self._check_access_denied(self.driver.page_source):
-                    raise Exception(f"Access denied detected on fallback page {page + 1} - no more fallback options")
-                
-                # Get page source and parse with BeautifulSoup
-                soup = self._parse_html(self.driver.page_source)
+                    logger.info(f"Loading fallback page {page + 1}: {current_url}")
+                    html = self._load_listing_html(current_url)
+
+                    # Check for access denied after loading each fallback page
+                    if self._check_access_denied(html):
+                        raise Exception(f"Access denied detected on fallback page {page + 1} - no more fallback options")
+
+                # Parse the page with BeautifulSoup
+                soup = self._parse_html(html)
                 
                 # Find press release items
                 items = soup.find_all("div", class_="views-row") or soup.find_all(
@@ -314,9 +372,12 @@ class DOJScraper(BaseScraper):
                     break
                 
                 page_articles = 0
-                articles_too_old = 0
+                items_in_range, articles_too_old = self._filter_items_by_date(
+                    items, start_date, end_date
+                )
+                self._prefetch_listing_items(items_in_range)
                 
-                for item in items:
+                for item in items_in_range:
                     try:
                         article = self._extract_article_from_item(
                             item, progress_callback
@@ -324,13 +385,13 @@ class DOJScraper(BaseScraper):
                         if article:
                             # Check if article is within our date range
                             if self._is_date_in_range(
-                                article["published_date"], start_obj, end_obj
+                                article["published_date"], start_date, end_date
                             ):
                                 articles.append(article)
                                 page_articles += 1
                             elif (
                                 article["published_date"]
-                                and article["published_date"].date() < start_obj
+                                and article["published_date"].date() < start_date
                             ):
                                 # Article is older than our range - count for early stopping
                                 articles_too_old += 1
@@ -365,9 +426,32 @@ class DOJScraper(BaseScraper):
         logger.info(f"Total DOJ articles scraped: {len(articles)}")
         return articles
     
+    def _load_listing_html(self, url):
+        """Return the HTML of the listing page at ``url``.
+
+        Listing pages are server-rendered, so they are fetched over plain
+        HTTP first. ChromeDriver renders the page instead when that fetch
+        fails or the CDN answers with its access-denied page; callers still
+        check the rendered page, since the browser can be refused too.
+        """
+        try:
+            response = self._make_request(url, expire_after=LISTING_PAGE_EXPIRY)
+            if not self._check_access_denied(response.text):
+                return response.text
+        except requests.RequestException as e:
+            logger.info(f"Static fetch of {url} failed: {e}")
+
+        logger.info(f"Rendering {url} in ChromeDriver instead")
+        self._throttle(url)
+        self.driver.get(url)
+        wait_for_element(self.driver, self._LISTING_ITEM_SELECTOR)
+        return self.driver.page_source
+
     def _process_page_items(self, items, start_date, end_date, progress_callback=None):
         """Process page items and return articles within date range."""
         page_articles = []
+        items, _ = self._filter_items_by_date(items, start_date, end_date)
+        self._prefetch_listing_items(items)
         
         for item in items:
             try:
@@ -385,17 +469,59 @@ class DOJScraper(BaseScraper):
         
         return page_articles
     
+    def _filter_items_by_date(self, items, start_date, end_date):
+        """Drop listing items whose listing date falls outside the range.
+
+        Items are filtered before any article page is fetched. Items without
+        a date on the listing are kept, since their date comes from the
+        article page.
+
+        Returns:
+            (items_in_range, too_old) -- the kept items and how many were
+            dropped for predating ``start_date``
+        """
+        items_in_range = []
+        too_old = 0
+        for item in items:
+            published_date = self._extract_date_from_item(item)
+            if not published_date or self._is_date_in_range(
+                published_date, start_date, end_date
+            ):
+                items_in_range.append(item)
+            elif published_date.date() < start_date:
+                too_old += 1
+        return items_in_range, too_old
+
+    @staticmethod
+    def _find_item_title_elem(item):
+        """Return the element holding a press release item's title."""
+        return (
+            item.find("h3", class_="node__title")
+            or item.find("h2", class_="node__title")
+            or item.find("h3")
+            or item.find("h2")
+            or item.find("a", class_="node__title-link")
+        )
+
+    def _prefetch_listing_items(self, items):
+        """Prefetch title checks and article pages for a listing page."""
+        entries = []
+        for item in items:
+            title_elem = self._find_item_title_elem(item)
+            if not title_elem:
+                continue
+            link_elem = title_elem if title_elem.name == "a" else title_elem.find("a")
+            href = link_elem.get("href") if link_elem else None
+            if href and self._resolve_url(href) in self._seen_article_urls:
+                continue
+            entries.append((self._clean_text(title_elem.get_text()), href))
+        self._prefetch_listing(entries)
+
     def _extract_article_from_item(self, item, progress_callback=None):
         """Extract article data from a press release item."""
         try:
             # Find title and link
-            title_elem = (
-                item.find("h3", class_="node__title")
-                or item.find("h2", class_="node__title")
-                or item.find("h3")
-                or item.find("h2")
-                or item.find("a", class_="node__title-link")
-            )
+            title_elem = self._find_item_title_elem(item)
             
             if not title_elem:
                 return None
@@ -412,19 +538,26 @@ class DOJScraper(BaseScraper):
             if self._article_exists_by_title(title):
                 logger.debug(f"Exists: {title}...")
                 return None
+
+            # Skip releases already picked up from an earlier listing page
+            if url in self._seen_article_urls:
+                logger.debug(f"Article already scraped: {url}")
+                return None
+            self._seen_article_urls.add(url)
             
             # Extract date from the listing
             published_date = self._extract_date_from_item(item)
-            if not published_date:
-                # Fallback: extract from individual page
-                published_date = self._extract_date_from_page(url)
-            
+            if published_date:
+                # Get full content from individual page
+                content = self._extract_full_content(url, progress_callback)
+            else:
+                # Fallback: take the date and content from one page load
+                published_date, content = self._extract_page(url, progress_callback)
+
             if not published_date:
                 logger.warning(f"Could not determine date for article: {title}")
                 return None
-            
-            # Get full content from individual page
-            content = self._extract_full_content(url, progress_callback)
+
             if not content:
                 logger.warning(f"Could not extract content for: {title}")
                 return None
@@ -445,136 +578,88 @@ class DOJScraper(BaseScraper):
         """Extract publication date from a press release item."""
         try:
             # Look for various date element patterns
-            date_selectors = [
-                "time[datetime]",
-                ".date-display-single",
-                ".submitted",
-                ".node__meta time",
-                ".field--name-created time",
-            ]
-            
-            for selector in date_selectors:
-                date_elem = item.select_one(selector)
-                if date_elem:
-                    date_str = date_elem.get("datetime") or date_elem.get_text()
-                    parsed_date = self._parse_date(date_str)
-                    if parsed_date:
-                        return parsed_date
+            for date_elem in select_first_matches(
+                item, self._ITEM_DATE_SELECTORS, self._ITEM_DATE_SELECTOR_UNION
+            ):
+                parsed_date = self._parse_date_elem(date_elem)
+                if parsed_date:
+                    return parsed_date
                         
         except Exception:
             pass
             
         return None
     
-    def _is_date_in_range(self, date: datetime, start_date, end_date) -> bool:
-        """Check if a date falls within the specified range."""
-        if not date:
-            return False
-            
-        # Convert to date objects for comparison
-        date_obj = date.date() if hasattr(date, "date") else date
-        start_obj = (
-            start_date
-            if hasattr(start_date, "year")
-            else datetime.strptime(str(start_date), "%Y-%m-%d").date()
-        )
-        end_obj = (
-            end_date
-            if hasattr(end_date, "year")
-            else datetime.strptime(str(end_date), "%Y-%m-%d").date()
-        )
-        
-        return start_obj <= date_obj <= end_obj
-    
     def _extract_full_content(self, url: str, progress_callback=None) -> Optional[str]:
         """Extract full content from a DOJ press release page."""
         try:
-            if progress_callback:
-                progress_callback(f"Loading full content from: {url}")
-            else:
-                logger.info(f"Loading full content from: {url}")
-            self.driver.get(url)
-            
-            # Wait for page to load
-            time.sleep(2)
-            
-            # Get page source and parse with BeautifulSoup
-            soup = self._parse_html(self.driver.page_source)
-            
-            # DOJ-specific content selectors (in order of preference)
-            content_selectors = [
-                ".field--name-body",  # Main body field
-                ".field--name-field-pr-body",  # Press release body
-                ".node-content",  # Node content wrapper
-                ".region-content",  # Content region
-                "#main-content",  # Main content area
-                ".page-content",  # Page content
-                "main",  # HTML5 main element
-                "article .content",  # Article content
-            ]
-            
-            content = None
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    # Remove unwanted elements
-                    for unwanted in content_elem(
-                        ["script", "style", "nav", "aside", "footer", "header"]
-                    ):
-                        unwanted.decompose()
-                    
-                    # Also remove social sharing, related links, etc.
-                    for unwanted_class in [
-                        ".social-share",
-                        ".related-links",
-                        ".tags",
-                        ".breadcrumb",
-                    ]:
-                        for elem in content_elem.select(unwanted_class):
-                            elem.decompose()
-                    
-                    content = self._clean_text(content_elem.get_text())
-                    
-                    # Check if we got substantial content (at least 100 characters)
-                    if content and len(content.strip()) > 100:
-                        break
-            
-            if not content or len(content.strip()) < 50:
-                logger.warning(f"Insufficient content extracted from {url}")
-                return None
-                
-            # Log content length instead of the actual content to avoid bloating logs
-            logger.debug(
-                f"Successfully extracted {len(content.strip())} characters of content from {url}"
-            )
-            return content.strip()
-                    
+            soup = self._load_article_soup(url, progress_callback)
+            return self._content_from_soup(soup, url)
         except Exception as e:
             logger.error(f"Error extracting content from {url}: {e}")
             
         return None
     
-    def _extract_date_from_page(self, url: str) -> Optional[datetime]:
-        """Extract publication date from individual page."""
+    def _extract_page(self, url: str, progress_callback=None):
+        """Extract both the publication date and content from one page load.
+
+        Returns:
+            (published_date, content) tuple; either may be None
+        """
         try:
-            self.driver.get(url)
-            time.sleep(1)  # Brief wait for page load
-            soup = self._parse_html(self.driver.page_source)
-            
-            # Look for date elements
-            date_selectors = ["time[datetime]", ".date-display-single", ".submitted"]
-            
-            for selector in date_selectors:
-                date_elem = soup.select_one(selector)
-                if date_elem:
-                    date_str = date_elem.get("datetime") or date_elem.get_text()
-                    return self._parse_date(date_str)
-                    
+            soup = self._load_article_soup(url, progress_callback)
+        except Exception as e:
+            logger.error(f"Error extracting content from {url}: {e}")
+            return None, None
+
+        published_date = None
+        try:
+            date_elems = select_first_matches(
+                soup, self._DATE_SELECTORS, self._DATE_SELECTOR_UNION
+            )
+            if date_elems:
+                published_date = self._parse_date_elem(date_elems[0])
         except Exception:
             pass
+
+        if not published_date:
+            return None, None
+        return published_date, self._content_from_soup(soup, url)
+
+    def _load_article_soup(self, url: str, progress_callback=None):
+        """Load a press release page once and parse it."""
+        if progress_callback:
+            progress_callback(f"Loading full content from: {url}")
+        else:
+            logger.info(f"Loading full content from: {url}")
+        html = self._load_article_page(
+            url, render_wait=2, ready_selector=self._CONTENT_READY_SELECTOR
+        )
+        return self._parse_html(html)
+
+    def _content_from_soup(self, soup, url: str) -> Optional[str]:
+        """Pull the body text out of a parsed press release page."""
+        content = self._select_content_text(soup, self._CONTENT_SELECTORS)
+        
+        if not content or len(content.strip()) < 50:
+            logger.warning(f"Insufficient content extracted from {url}")
+            return None
             
-        return None
+        # Log content length instead of the actual content to avoid bloating logs
+        logger.debug(
+            f"Successfully extracted {len(content.strip())} characters of content from {url}"
+        )
+        return content.strip()
     
+    def _parse_date_elem(self, date_elem) -> Optional[datetime]:
+        """Parse the date carried by a ``<time>`` or other date element."""
+        iso_date = date_elem.get("datetime")
+        if iso_date:
+            parsed_date = parse_iso_datetime_to_utc(iso_date)
+            if parsed_date:
+                return parsed_date
+        return self._parse_date(iso_date or date_elem.get_text())
+
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse various date formats from DOJ website and return UTC datetime."""
         from ..utils.timezone_utils import parse_date_to_utc
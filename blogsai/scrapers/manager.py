@@ -26,6 +26,7 @@ Usage:
 """
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Any
 from sqlalchemy.exc import IntegrityError
@@ -95,26 +96,34 @@ class ScraperManager:
 
     def _init_scrapers(self):
         import logging
-        import time
         
         logger = logging.getLogger(__name__)
         classes = {"doj": DOJScraper, "sec": SECScraper, "cftc": CFTCScraper}
 
         # Only initialize government agency scrapers
-        # Add delay between initializations to avoid ChromeDriver conflicts
-        for i, (name, config) in enumerate(self.config.sources.get("agencies", {}).items()):
-            if name in classes:
-                try:
-                    logger.info(f"Initializing {name} scraper...")
-                    self.scrapers[name] = classes[name](config, self.config.scraping)
-                    
-                    # Add delay between scraper initializations to prevent conflicts
-                    if i < len(self.config.sources.get("agencies", {})) - 1:  # Not the last one
-                        time.sleep(2.0)  # 2 second delay to prevent ChromeDriver conflicts
-                        
-                except Exception as e:
-                    logger.error(f"Failed to initialize {name} scraper: {e}")
-                    # Continue with other scrapers even if one fails
+        agencies = [
+            (name, config)
+            for name, config in self.config.sources.get("agencies", {}).items()
+            if name in classes
+        ]
+
+        # Construct the scrapers concurrently: each one blocks on starting its
+        # own ChromeDriver, and each uses its own debugging port, so they no
+        # longer need to be started seconds apart
+        with ThreadPoolExecutor(max_workers=max(len(agencies), 1)) as executor:
+            futures = []
+            for name, config in agencies:
+                logger.info(f"Initializing {name} scraper...")
+                futures.append(
+                    (name, executor.submit(classes[name], config, self.config.scraping))
+                )
+
+        for name, future in futures:
+            try:
+                self.scrapers[name] = future.result()
+            except Exception as e:
+                logger.error(f"Failed to initialize {name} scraper: {e}")
+                # Continue with other scrapers even if one fails
 
     def scrape_all_sources(self, days_back: int = 1) -> Dict[str, Any]:
         """Scrape all configured sources with proper error handling and logging."""
@@ -16,23 +16,38 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
-from .base import BaseScraper
-from ._common import setup_chrome_options, log_safe_content, initialize_chrome_driver
+from ..utils.timezone_utils import parse_iso_datetime_to_utc
+from .base import BaseScraper, compile_selectors
+from ._common import setup_chrome_options, log_safe_content, chrome_driver_pool
 
 logger = logging.getLogger(__name__)
 
 
 class SECScraper(BaseScraper):
     """Scraper for SEC press releases using Selenium."""
+
+    # Links in a listing row that point at a press release
+    _PRESS_RELEASE_HREF_RE = re.compile(r"/newsroom/press-releases/")
+
+    # SEC-specific content selectors (in order of preference)
+    _CONTENT_SELECTORS = compile_selectors(
+        ".field--name-body",  # Main body field
+        ".field--name-field-display-title",  # SEC display title
+        ".node-content",  # Node content wrapper
+        ".region-content",  # Content region
+        "#main-content",  # Main content area
+        ".page-content",  # Page content
+        "main",  # HTML5 main element
+        "article .content",  # Article content
+    )
     
     def __init__(self, source_config, scraping_config):
         super().__init__(source_config, scraping_config)
         
-        # Initialize ChromeDriver using the common helper function
-        self.driver = initialize_chrome_driver(self.source_config.name)
+        # Take a warm ChromeDriver from the shared pool, or initialize a new one
+        self.driver = chrome_driver_pool.acquire(self.source_config.name)
         
         if self.driver:
-            self.driver.implicitly_wait(10)
             logger.debug(f"ChromeDriver session ID: {self.driver.session_id}")
             
             # Use weakref.finalize for more reliable cleanup
@@ -51,14 +66,16 @@ class SECScraper(BaseScraper):
                 logger.warning(f"Error in finalizer cleanup: {e}")
         
     def close(self):
-        """Explicitly close the WebDriver."""
+        """Explicitly release the WebDrivers back to the shared driver pool."""
+        self._release_render_drivers()
         if hasattr(self, "driver") and self.driver:
             try:
                 logger.debug(f"Closing ChromeDriver for {self.source_config.name}")
                 # Cancel the finalizer since we're explicitly closing
                 if hasattr(self, "_finalizer"):
                     self._finalizer.detach()
-                self.driver.quit()
+                # Hand the session back to the pool for the next scrape run
+                chrome_driver_pool.release(self.source_config.name, self.driver)
                 self.driver = None
             except Exception as e:
                 logger.warning(
@@ -118,6 +135,7 @@ class SECScraper(BaseScraper):
             return []
         
         articles = []
+        self._seen_article_urls = set()
         
         # Convert dates to date objects for comparison
         start_obj = (
@@ -267,6 +285,9 @@ class SECScraper(BaseScraper):
                         break
 
                     page_articles = []
+                    self._prefetch_listing_rows(
+                        press_release_rows, start_date, end_date
+                    )
                     for row in press_release_rows:
                         try:
                             article = self._extract_article_from_row(
@@ -345,6 +366,7 @@ class SECScraper(BaseScraper):
                     break
 
                 page_articles = []
+                self._prefetch_listing_rows(press_release_rows, start_date, end_date)
                 for row in press_release_rows:
                     try:
                         article = self._extract_article_from_row(
@@ -380,6 +402,43 @@ class SECScraper(BaseScraper):
             )
             return articles
 
+    @classmethod
+    def _find_row_title_link(cls, row):
+        """Return the press release link that carries a row's title."""
+        return row.find("a", href=cls._PRESS_RELEASE_HREF_RE)
+
+    def _row_date(self, row) -> Optional[datetime]:
+        """Return the publication date in a listing row's ``<time>`` element."""
+        date_elem = row.find("time", class_="datetime")
+        if not date_elem:
+            return None
+        iso_date = date_elem.get("datetime")
+        if iso_date:
+            published_date = parse_iso_datetime_to_utc(iso_date)
+            if published_date:
+                return published_date
+        return self._parse_date(iso_date or date_elem.get_text())
+
+    def _prefetch_listing_rows(self, rows, start_date, end_date):
+        """Prefetch title checks and article pages for a listing page.
+
+        Only rows dated within the range and not already seen this run are
+        prefetched, so article pages are rendered just for the releases the
+        per-row loop can keep.
+        """
+        entries = []
+        for row in rows:
+            link = self._find_row_title_link(row)
+            href = link.get("href") if link else None
+            if not href or self._resolve_url(href) in self._seen_article_urls:
+                continue
+            published_date = self._row_date(row)
+            if published_date and self._is_date_in_range(
+                published_date, start_date, end_date
+            ):
+                entries.append((self._clean_text(link.get_text()), href))
+        self._prefetch_listing(entries)
+
     def _extract_article_from_row(self, row, start_date, end_date):
         """Extract article data from a SEC press release table row."""
         try:
@@ -389,10 +448,10 @@ class SECScraper(BaseScraper):
             if not date_elem:
                 return None
 
-            date_str = date_elem.get("datetime") or date_elem.get_text()
-            published_date = self._parse_date(date_str)
+            published_date = self._row_date(row)
 
             if not published_date:
+                date_str = date_elem.get("datetime") or date_elem.get_text()
                 logger.warning(f"Could not parse date: {date_str}")
                 return None
 
@@ -402,7 +461,7 @@ class SECScraper(BaseScraper):
 
             # Extract title and link
             # Based on HTML: <a href="/newsroom/press-releases/2015-249" hreflang="en">SEC Adopts Rules to Permit Crowdfunding</a>
-            title_elem = row.find("a", href=re.compile(r"/newsroom/press-releases/"))
+            title_elem = self._find_row_title_link(row)
             if not title_elem:
                 return None
 
@@ -414,6 +473,12 @@ class SECScraper(BaseScraper):
                 logger.debug(f"Article already exists: {title}...")
                 return None
 
+            # Skip releases already picked up from another row or page
+            if url in self._seen_article_urls:
+                logger.debug(f"Article already scraped: {url}")
+                return None
+            self._seen_article_urls.add(url)
+
             # Extract release number if available
             # Based on HTML: <td headers="view-field-release-number-table-column" class="views-field views-field-field-release-number">2015-249</td>
             release_number = None
@@ -440,26 +505,6 @@ class SECScraper(BaseScraper):
             logger.error(f"Error extracting article from SEC row: {e}")
             return None
 
-    def _is_date_in_range(self, date: datetime, start_date, end_date) -> bool:
-        """Check if a date falls within the specified range."""
-        if not date:
-            return False
-
-        # Convert to date objects for comparison
-        date_obj = date.date() if hasattr(date, "date") else date
-        start_obj = (
-            start_date
-            if hasattr(start_date, "year")
-            else datetime.strptime(str(start_date), "%Y-%m-%d").date()
-        )
-        end_obj = (
-            end_date
-            if hasattr(end_date, "year")
-            else datetime.strptime(str(end_date), "%Y-%m-%d").date()
-        )
-
-        return start_obj <= date_obj <= end_obj
-
     def _extract_full_content(self, url: str, progress_callback=None) -> Optional[str]:
         """Extract full content from a SEC press release page."""
         try:
@@ -467,51 +512,9 @@ class SECScraper(BaseScraper):
                 progress_callback(f"Loading full content from: {url}")
             else:
                 logger.info(f"Loading full content from: {url}")
-            self.driver.get(url)
-
-            # Wait for page to load
-            time.sleep(2)
-
-            # Get page source and parse with BeautifulSoup
-            soup = self._parse_html(self.driver.page_source)
-
-            # SEC-specific content selectors (in order of preference)
-            content_selectors = [
-                ".field--name-body",  # Main body field
-                ".field--name-field-display-title",  # SEC display title
-                ".node-content",  # Node content wrapper
-                ".region-content",  # Content region
-                "#main-content",  # Main content area
-                ".page-content",  # Page content
-                "main",  # HTML5 main element
-                "article .content",  # Article content
-            ]
-
-            content = None
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    # Remove unwanted elements
-                    for unwanted in content_elem(
-                        ["script", "style", "nav", "aside", "footer", "header"]
-                    ):
-                        unwanted.decompose()
-
-                    # Also remove social sharing, related links, etc.
-                    for unwanted_class in [
-                        ".social-share",
-                        ".related-links",
-                        ".tags",
-                        ".breadcrumb",
-                    ]:
-                        for elem in content_elem.select(unwanted_class):
-                            elem.decompose()
-
-                    content = self._clean_text(content_elem.get_text())
-
-                    # Check if we got substantial content (at least 100 characters)
-                    if content and len(content.strip()) > 100:
-                        break
+            soup = self._parse_html(self._load_article_page(url, render_wait=2))
+
+            content = self._select_content_text(soup, self._CONTENT_SELECTORS)
                             
             if not content or len(content.strip()) < 50:
                 logger.warning(f"Insufficient content extracted from {url}")
@@ -8,13 +8,69 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
 from urllib.parse import urlparse
 
 from ..core import get_db, config
 from ..database.models import Article, Source
 from ..analysis.openai_client import OpenAIAnalyzer
-from .base import BaseScraper
+from .base import BaseScraper, DO_NOT_CACHE, compile_selectors
+
+
+# Elements stripped from a page before its visible text is taken
+_UNWANTED_TAGS = [
+    "script",
+    "style",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "iframe",
+    "noscript",
+    "form",
+    "button",
+    "input",
+    "select",
+    "textarea",
+]
+# Common ad/navigation classes and IDs, combined into one selector so the
+# page is walked once rather than once per pattern
+_UNWANTED_SELECTOR = soupsieve.compile(
+    ", ".join(
+        [
+            '[class*="nav"]',
+            '[class*="menu"]',
+            '[class*="sidebar"]',
+            '[class*="ad"]',
+            '[class*="advertisement"]',
+            '[class*="banner"]',
+            '[class*="popup"]',
+            '[class*="modal"]',
+            '[class*="cookie"]',
+            '[class*="social"]',
+            '[class*="share"]',
+            '[class*="comment"]',
+            '[id*="nav"]',
+            '[id*="menu"]',
+            '[id*="sidebar"]',
+            '[id*="ad"]',
+            '[id*="advertisement"]',
+            '[id*="banner"]',
+        ]
+    )
+)
+# Main content areas, in order of preference
+_MAIN_CONTENT_SELECTORS = compile_selectors(
+    "main",
+    "article",
+    '[role="main"]',
+    ".content",
+    ".main-content",
+    ".article-content",
+    ".post-content",
+    ".entry-content",
+    ".page-content",
+)
 
 
 class URLScraper(BaseScraper):
@@ -78,8 +134,9 @@ WEBPAGE CONTENT TO ANALYZE:
         try:
             print(f"Scraping URL: {url}")
 
-            # Step 1: Fetch the webpage
-            response = self._make_request(url)
+            # Step 1: Fetch the webpage; a URL submitted again should be
+            # scraped as it is now, not as the HTTP cache last saw it
+            response = self._make_request(url, expire_after=DO_NOT_CACHE)
             if not response:
                 return {
                     "success": False,
@@ -150,71 +207,20 @@ WEBPAGE CONTENT TO ANALYZE:
         Returns:
             Clean visible text content
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._parse_html(html)
 
         # Remove unwanted elements
-        unwanted_tags = [
-            "script",
-            "style",
-            "nav",
-            "header",
-            "footer",
-            "aside",
-            "iframe",
-            "noscript",
-            "form",
-            "button",
-            "input",
-            "select",
-            "textarea",
-        ]
-
-        for tag in unwanted_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
+        for element in soup(_UNWANTED_TAGS):
+            element.decompose()
 
         # Remove elements with common ad/navigation classes and IDs
-        unwanted_selectors = [
-            '[class*="nav"]',
-            '[class*="menu"]',
-            '[class*="sidebar"]',
-            '[class*="ad"]',
-            '[class*="advertisement"]',
-            '[class*="banner"]',
-            '[class*="popup"]',
-            '[class*="modal"]',
-            '[class*="cookie"]',
-            '[class*="social"]',
-            '[class*="share"]',
-            '[class*="comment"]',
-            '[id*="nav"]',
-            '[id*="menu"]',
-            '[id*="sidebar"]',
-            '[id*="ad"]',
-            '[id*="advertisement"]',
-            '[id*="banner"]',
-        ]
-
-        for selector in unwanted_selectors:
-            for element in soup.select(selector):
-                element.decompose()
+        for element in _UNWANTED_SELECTOR.select(soup):
+            element.decompose()
 
         # Extract text from main content areas first
         main_content = None
-        main_selectors = [
-            "main",
-            "article",
-            '[role="main"]',
-            ".content",
-            ".main-content",
-            ".article-content",
-            ".post-content",
-            ".entry-content",
-            ".page-content",
-        ]
-
-        for selector in main_selectors:
-            main_element = soup.select_one(selector)
+        for selector in _MAIN_CONTENT_SELECTORS:
+            main_element = selector.select_one(soup)
             if main_element:
                 main_content = main_element.get_text(separator=" ", strip=True)
                 break
@@ -1,9 +1,29 @@
 """Timezone utilities for consistent date handling."""
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 import pytz
 
+# Common date formats
+_DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%fZ",  # ISO with microseconds
+    "%Y-%m-%dT%H:%M:%SZ",     # ISO with seconds
+    "%Y-%m-%dT%H:%M:%S",      # ISO without timezone
+    "%Y-%m-%d %H:%M:%S",      # Standard SQL format
+    "%Y-%m-%d",               # Date only
+    "%B %d, %Y",              # "January 1, 2024"
+    "%b %d, %Y",              # "Jan 1, 2024"
+    "%b. %d, %Y",             # "Jan. 1, 2024"
+    "%m/%d/%Y",               # "1/1/2024"
+    "%Y/%m/%d",               # "2024/01/01"
+    "%m.%d.%Y",               # "1.1.2024"
+)
+
+# The format that parsed the previous date; a source's listing uses one
+# format throughout, so trying it first skips the failed strptime calls
+_last_date_format = None
+
 
 def get_utc_now() -> datetime:
     """Get current UTC datetime with timezone info."""
@@ -98,6 +118,34 @@ def format_local_date(dt: datetime, format_str: str = "%Y-%m-%d") -> str:
     return local_dt.strftime(format_str)
 
 
+def parse_iso_datetime_to_utc(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp that carries a UTC offset.
+
+    This is the fast path for machine-readable values such as the
+    ``datetime`` attribute of ``<time>`` elements. Values without an offset
+    return None so callers can fall back to ``parse_date_to_utc`` and its
+    source-timezone handling.
+
+    Args:
+        value: ISO 8601 string, e.g. "2024-01-05T14:30:00Z"
+
+    Returns:
+        datetime: UTC datetime with timezone info, or None
+    """
+    value = value.strip()
+    # datetime.fromisoformat only accepts a "Z" suffix from Python 3.11
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        return None
+    return dt.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=4096)
 def parse_date_to_utc(date_str: str, source_timezone: Optional[str] = None) -> Optional[datetime]:
     """Parse date string and convert to UTC.
     
@@ -111,25 +159,16 @@ def parse_date_to_utc(date_str: str, source_timezone: Optional[str] = None) -> O
     if not date_str:
         return None
         
-    # Common date formats
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%fZ",  # ISO with microseconds
-        "%Y-%m-%dT%H:%M:%SZ",     # ISO with seconds
-        "%Y-%m-%dT%H:%M:%S",      # ISO without timezone
-        "%Y-%m-%d %H:%M:%S",      # Standard SQL format
-        "%Y-%m-%d",               # Date only
-        "%B %d, %Y",              # "January 1, 2024"
-        "%b %d, %Y",              # "Jan 1, 2024"
-        "%b. %d, %Y",             # "Jan. 1, 2024"
-        "%m/%d/%Y",               # "1/1/2024"
-        "%Y/%m/%d",               # "2024/01/01"
-        "%m.%d.%Y",               # "1.1.2024"
-    ]
-    
+    global _last_date_format
+    formats = _DATE_FORMATS
+    if _last_date_format is not None:
+        formats = (_last_date_format,) + formats
+
     for fmt in formats:
         try:
             dt = datetime.strptime(date_str.strip(), fmt)
-            
+            _last_date_format = fmt
+
             # If timezone info is already present, convert to UTC
             if dt.tzinfo is not None:
                 return dt.astimezone(timezone.utc)
@@ -0,0 +1,168 @@
+"""Tests for the ChromeDriverPool class."""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch, MagicMock, PropertyMock
+
+from selenium.common.exceptions import WebDriverException
+
+from blogsai.scrapers import _common
+from blogsai.scrapers._common import ChromeDriverPool
+
+
+class TestChromeDriverPool(unittest.TestCase):
+    """Test cases for the ChromeDriverPool class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.pool = ChromeDriverPool()
+
+    @patch.object(_common, "initialize_chrome_driver")
+    def test_released_driver_is_reused(self, mock_init):
+        """Test that a released driver is handed out again without a cold start."""
+        mock_driver = MagicMock()
+        mock_init.return_value = mock_driver
+
+        driver = self.pool.acquire("Department of Justice")
+        self.pool.release("Department of Justice", driver)
+
+        self.assertIs(self.pool.acquire("Department of Justice"), mock_driver)
+        mock_init.assert_called_once_with("Department of Justice")
+
+    @patch.object(_common, "initialize_chrome_driver")
+    def test_idle_driver_is_shared_across_scrapers(self, mock_init):
+        """Test that a scraper borrows another scraper's idle driver."""
+        mock_driver = MagicMock()
+        self.pool.release("Department of Justice", mock_driver)
+
+        driver = self.pool.acquire("Securities and Exchange Commission")
+
+        self.assertIs(driver, mock_driver)
+        mock_init.assert_not_called()
+
+    @patch.object(_common, "initialize_chrome_driver")
+    def test_dead_driver_is_replaced(self, mock_init):
+        """Test that a pooled driver whose session died is quit and replaced."""
+        dead_driver = MagicMock()
+        type(dead_driver).current_url = PropertyMock(
+            side_effect=WebDriverException("session deleted")
+        )
+        fresh_driver = MagicMock()
+        mock_init.return_value = fresh_driver
+
+        self.pool.release("Department of Justice", dead_driver)
+
+        self.assertIs(self.pool.acquire("Department of Justice"), fresh_driver)
+        dead_driver.quit.assert_called_once()
+
+    @patch.object(_common, "initialize_chrome_driver")
+    def test_new_driver_blocks_resource_urls(self, mock_init):
+        """Test that a freshly started driver blocks images, fonts and analytics."""
+        new_driver = MagicMock()
+        mock_init.return_value = new_driver
+
+        self.pool.acquire("Department of Justice")
+
+        new_driver.execute_cdp_cmd.assert_any_call(
+            "Network.setBlockedURLs", {"urls": list(_common._BLOCKED_URL_PATTERNS)}
+        )
+
+    @patch.object(_common, "initialize_chrome_driver")
+    def test_stylesheets_blocked_only_when_requested(self, mock_init):
+        """Test that a reused driver's block list follows the acquiring scraper."""
+        mock_driver = MagicMock()
+        self.pool.release("Department of Justice", mock_driver)
+
+        self.pool.acquire(
+            "Commodity Futures Trading Commission", block_stylesheets=True
+        )
+
+        mock_driver.execute_cdp_cmd.assert_called_with(
+            "Network.setBlockedURLs",
+            {"urls": list(_common._BLOCKED_URL_PATTERNS) + ["*.css"]},
+        )
+
+    def test_release_quits_drivers_beyond_idle_limit(self):
+        """Test that releasing more drivers than the idle limit quits the extras."""
+        pooled_driver = MagicMock()
+        extra_driver = MagicMock()
+
+        self.pool.release("Department of Justice", pooled_driver)
+        self.pool.release("Department of Justice", extra_driver)
+
+        pooled_driver.quit.assert_not_called()
+        extra_driver.quit.assert_called_once()
+
+    def test_close_all_quits_idle_drivers(self):
+        """Test that close_all quits every idle driver."""
+        mock_driver = MagicMock()
+        self.pool.release("Department of Justice", mock_driver)
+
+        self.pool.close_all()
+
+        mock_driver.quit.assert_called_once()
+
+
+class TestChromeDriverPoolCookies(unittest.TestCase):
+    """Test cases for cookie persistence in ChromeDriverPool."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cookie_dir = Path(self.temp_dir.name)
+        self.pool = ChromeDriverPool(cookie_dir=self.cookie_dir)
+        self.cookies = [
+            {
+                "name": "session",
+                "value": "abc",
+                "domain": ".justice.gov",
+                "path": "/",
+                "secure": True,
+                "httpOnly": True,
+                "expiry": 1900000000,
+            }
+        ]
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    @patch.object(_common, "initialize_chrome_driver")
+    def test_saved_cookies_restored_into_new_driver(self, mock_init):
+        """Test that cookies saved on release are injected into a new driver."""
+        old_driver = MagicMock()
+        old_driver.get_cookies.return_value = self.cookies
+        self.pool.release("Department of Justice", old_driver)
+
+        new_driver = MagicMock()
+        mock_init.return_value = new_driver
+        ChromeDriverPool(cookie_dir=self.cookie_dir).acquire("Department of Justice")
+
+        cookie_param = dict(self.cookies[0])
+        cookie_param["expires"] = cookie_param.pop("expiry")
+        new_driver.execute_cdp_cmd.assert_any_call(
+            "Network.setCookies", {"cookies": [cookie_param]}
+        )
+
+    @patch.object(_common, "initialize_chrome_driver")
+    def test_expired_cookie_file_is_ignored(self, mock_init):
+        """Test that cookies older than the TTL are not restored."""
+        cookie_path = self.cookie_dir / "department-of-justice.json"
+        cookie_path.write_text(json.dumps(self.cookies))
+        stale = time.time() - _common._COOKIE_TTL_SECONDS - 60
+        os.utime(cookie_path, (stale, stale))
+        new_driver = MagicMock()
+        mock_init.return_value = new_driver
+
+        self.pool.acquire("Department of Justice")
+
+        cdp_commands = [c.args[0] for c in new_driver.execute_cdp_cmd.call_args_list]
+        self.assertNotIn("Network.setCookies", cdp_commands)
+
+
+if __name__ == "__main__":
+    unittest.main()
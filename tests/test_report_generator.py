@@ -159,6 +159,31 @@ class TestReportGenerator(unittest.TestCase):
             
             mock_makedirs.assert_called_once_with('/tmp/test_reports', exist_ok=True)
 
+    def test_clean_text_for_pdf_escapes_and_formats(self):
+        """Test PDF text cleaning output, including repeated cached inputs."""
+        text = "**Acme** & Co \u2014 <note>"
+        expected = "<b>Acme</b> &amp; Co -- &lt;note&gt;"
+
+        self.assertEqual(self.generator._clean_text_for_pdf(text), expected)
+        # Second call is served from the cache and must be identical
+        self.assertEqual(self.generator._clean_text_for_pdf(text), expected)
+        self.assertEqual(self.generator._clean_text_for_pdf(""), "")
+        self.assertEqual(self.generator._clean_text_for_pdf(None), "")
+        self.assertEqual(self.generator._clean_text_for_pdf("  \n "), "")
+
+    def test_format_source_detail_item_without_detail(self):
+        """Test that source-only items drop the trailing colon."""
+        self.assertEqual(
+            self.generator._format_source_detail_item("(a)", {"source": "CMS"}),
+            "(a) <b>CMS</b>",
+        )
+        self.assertEqual(
+            self.generator._format_source_detail_item(
+                "(b)", {"source": "HHS", "details": "Advisory"}
+            ),
+            "(b) <b>HHS:</b> Advisory",
+        )
+
 
 class TestReportGeneratorIntegration(unittest.TestCase):
     """Integration tests for ReportGenerator."""